@@ -565,7 +565,7 @@ async def run_council_with_fallback(
     elif models is not None:
         council_models = models
     elif tier_contract is not None:
-        council_models = tier_contract.allowed_models
+        council_models = list(tier_contract.allowed_models)
     else:
         council_models = _get_council_models()
 
@@ -958,8 +958,8 @@ def should_normalize_styles(responses: List[str]) -> bool:
     Returns:
         True if normalization would likely help reduce bias
     """
+    import math
     import re
-    import statistics
 
     if len(responses) < 2:
         return False
@@ -971,14 +971,13 @@ def should_normalize_styles(responses: List[str]) -> bool:
 
     # Heuristic 2: Length variance
     lengths = [len(r) for r in responses]
-    mean_length = statistics.mean(lengths)
+    mean_length = sum(lengths) / len(lengths)
     if mean_length > 0:
-        try:
-            cv = statistics.stdev(lengths) / mean_length  # Coefficient of variation
-            if cv > 0.5:  # High length variance
-                return True
-        except statistics.StatisticsError:
-            pass  # Not enough data points
+        # Sample standard deviation; len(responses) >= 2 is checked above
+        stdev = math.sqrt(sum((n - mean_length) ** 2 for n in lengths) / (len(lengths) - 1))
+        cv = stdev / mean_length  # Coefficient of variation
+        if cv > 0.5:  # High length variance
+            return True
 
     # Heuristic 3: AI preamble detection
     preambles = [
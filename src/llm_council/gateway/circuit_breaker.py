@@ -8,21 +8,37 @@ State Machine:
     OPEN -> (timeout expires) -> HALF_OPEN
     HALF_OPEN -> (success) -> CLOSED
     HALF_OPEN -> (failure) -> OPEN
+
+In HALF_OPEN only one probe request is admitted at a time, so a recovering
+service is not hit by every waiting caller at once.
 """
 
+import threading
 import time
-from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, Optional
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from .errors import CircuitOpenError
 
 
-class CircuitState(Enum):
-    """Circuit breaker states."""
+class CircuitState(IntEnum):
+    """Circuit breaker states.
+
+    Integer-valued so the per-request state checks are plain int compares;
+    use ``label`` for the string form exposed in stats and events.
+    """
+
+    CLOSED = 0  # Normal operation, requests allowed
+    OPEN = 1  # Failures exceeded threshold, requests blocked
+    HALF_OPEN = 2  # Testing recovery, one probe request at a time
+
+    @property
+    def label(self) -> str:
+        """Lower-case state name (e.g. ``"half_open"``)."""
+        return _STATE_NAMES[self]
+
 
-    CLOSED = "closed"  # Normal operation, requests allowed
-    OPEN = "open"  # Failures exceeded threshold, requests blocked
-    HALF_OPEN = "half_open"  # Testing recovery, limited requests allowed
+_STATE_NAMES = ("closed", "open", "half_open")
 
 
 class CircuitBreaker:
@@ -31,6 +47,10 @@ class CircuitBreaker:
     Monitors failures and temporarily blocks requests when a service
     becomes unhealthy, preventing cascading failures.
 
+    State updates are serialized by an internal lock so that each
+    check-and-transition is atomic when the breaker is shared across
+    threads (e.g. executor workers) as well as coroutines.
+
     Example:
         cb = CircuitBreaker(failure_threshold=5, timeout_seconds=30)
 
@@ -46,6 +66,7 @@ class CircuitBreaker:
         success_threshold: int = 1,
         timeout_seconds: float = 60.0,
         router_id: str = "default",
+        now_fn: Callable[[], int] = time.monotonic_ns,
     ):
         """Initialize the circuit breaker.
 
@@ -54,17 +75,24 @@ class CircuitBreaker:
             success_threshold: Number of successes in HALF_OPEN to close circuit.
             timeout_seconds: Time to wait before transitioning from OPEN to HALF_OPEN.
             router_id: Identifier for the associated router.
+            now_fn: Clock returning integer nanoseconds; monotonic by default
+                so the recovery timer is immune to wall-clock adjustments.
+                Tests may inject a fake clock.
         """
         self.failure_threshold = failure_threshold
         self.success_threshold = success_threshold
         self.timeout_seconds = timeout_seconds
+        self._timeout_ns = int(timeout_seconds * 1_000_000_000)
         self.router_id = router_id
+        self._now = now_fn
+        self._lock = threading.Lock()
 
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: Optional[float] = None
-        self._last_state_change: float = time.time()
+        self._last_failure_ns: Optional[int] = None
+        self._last_state_change_ns: int = self._now()
+        self._half_open_inflight = False
 
     @property
     def state(self) -> CircuitState:
@@ -76,10 +104,11 @@ class CircuitBreaker:
         """Return the current failure count."""
         return self._failure_count
 
-    def _transition_to(self, new_state: CircuitState) -> None:
-        """Transition to a new state."""
+    def _transition_to(self, new_state: CircuitState, now: Optional[int] = None) -> None:
+        """Transition to a new state. Caller must hold ``self._lock``."""
         self._state = new_state
-        self._last_state_change = time.time()
+        self._last_state_change_ns = self._now() if now is None else now
+        self._half_open_inflight = False
 
         if new_state == CircuitState.CLOSED:
             self._failure_count = 0
@@ -87,64 +116,122 @@ class CircuitBreaker:
         elif new_state == CircuitState.HALF_OPEN:
             self._success_count = 0
 
-    def record_failure(self) -> None:
-        """Record a failure and potentially trip the circuit."""
-        self._failure_count += 1
-        self._last_failure_time = time.time()
+    def record_failure(self, now: Optional[int] = None) -> None:
+        """Record a failure and potentially trip the circuit.
 
-        if self._state == CircuitState.CLOSED:
-            if self._failure_count >= self.failure_threshold:
-                self._transition_to(CircuitState.OPEN)
-        elif self._state == CircuitState.HALF_OPEN:
-            # Any failure in HALF_OPEN reopens the circuit
-            self._transition_to(CircuitState.OPEN)
-
-    def record_success(self) -> None:
-        """Record a success and potentially close the circuit."""
-        if self._state == CircuitState.CLOSED:
-            # Reset failure count on success in CLOSED state
-            self._failure_count = 0
-        elif self._state == CircuitState.HALF_OPEN:
-            self._success_count += 1
-            if self._success_count >= self.success_threshold:
-                self._transition_to(CircuitState.CLOSED)
+        Args:
+            now: Current clock reading in nanoseconds; read from the clock when omitted.
+        """
+        if now is None:
+            now = self._now()
+        with self._lock:
+            self._failure_count += 1
+            self._last_failure_ns = now
+
+            if self._state == CircuitState.CLOSED:
+                if self._failure_count >= self.failure_threshold:
+                    self._transition_to(CircuitState.OPEN, now)
+            elif self._state == CircuitState.HALF_OPEN:
+                # Any failure in HALF_OPEN reopens the circuit
+                self._transition_to(CircuitState.OPEN, now)
+
+    def record_success(self, now: Optional[int] = None) -> None:
+        """Record a success and potentially close the circuit.
 
-    def allow_request(self) -> bool:
+        Args:
+            now: Current clock reading in nanoseconds; read from the clock when omitted.
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                # Reset failure count on success in CLOSED state
+                self._failure_count = 0
+            elif self._state == CircuitState.HALF_OPEN:
+                self._half_open_inflight = False
+                self._success_count += 1
+                if self._success_count >= self.success_threshold:
+                    self._transition_to(CircuitState.CLOSED, now)
+
+    def allow_request(self, now: Optional[int] = None) -> bool:
         """Check if a request should be allowed.
 
+        Args:
+            now: Current clock reading in nanoseconds; read from the clock when omitted.
+
         Returns:
             True if the request should proceed, False otherwise.
         """
-        if self._state == CircuitState.CLOSED:
-            return True
-        elif self._state == CircuitState.OPEN:
-            # Check if timeout has expired
-            if self._last_failure_time is not None:
-                elapsed = time.time() - self._last_failure_time
-                if elapsed >= self.timeout_seconds:
-                    self._transition_to(CircuitState.HALF_OPEN)
-                    return True
-            return False
-        elif self._state == CircuitState.HALF_OPEN:
-            # Allow limited requests in HALF_OPEN
-            return True
+        return self._admit(now)[0]
 
-        return False
+    def _admit(self, now: Optional[int] = None) -> Tuple[bool, bool]:
+        """Decide whether a request may proceed and whether it holds the probe slot.
+
+        Args:
+            now: Current clock reading in nanoseconds; read from the clock when omitted.
+
+        Returns:
+            Tuple of (allowed, is_probe). Only the caller that got is_probe=True
+            may call release_probe(); anyone else would free the real probe's slot.
+        """
+        # Unlocked fast path: reading a single attribute is atomic
+        if self._state == CircuitState.CLOSED:
+            return True, False
+
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True, False
+            elif self._state == CircuitState.OPEN:
+                # Check if timeout has expired
+                if self._last_failure_ns is not None:
+                    if now is None:
+                        now = self._now()
+                    if now - self._last_failure_ns >= self._timeout_ns:
+                        # The caller that trips the transition is the probe
+                        self._transition_to(CircuitState.HALF_OPEN, now)
+                        self._half_open_inflight = True
+                        return True, True
+                return False, False
+            elif self._state == CircuitState.HALF_OPEN:
+                # Admit a single probe until its outcome is recorded
+                if not self._half_open_inflight:
+                    self._half_open_inflight = True
+                    return True, True
+                return False, False
+
+        return False, False
+
+    def release_probe(self) -> None:
+        """Free the HALF_OPEN probe slot without recording an outcome.
+
+        Call this only from the request that was admitted as the probe, when it
+        ends without record_success() or record_failure() (e.g. cancellation or
+        an inconclusive response), so the next caller can probe the service.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_inflight = False
 
     def get_stats(self) -> Dict[str, Any]:
         """Return current circuit breaker statistics.
 
+        Timestamps are clock readings (monotonic by default), exposed both in
+        nanoseconds and as float seconds.
+
         Returns:
             Dict with state, counts, and timing information.
         """
-        return {
-            "state": self._state.value,
-            "failure_count": self._failure_count,
-            "success_count": self._success_count,
-            "last_failure_time": self._last_failure_time,
-            "last_state_change": self._last_state_change,
-            "router_id": self.router_id,
-        }
+        with self._lock:
+            last_failure_ns = self._last_failure_ns
+            return {
+                "state": self._state.label,
+                "failure_count": self._failure_count,
+                "success_count": self._success_count,
+                "last_failure_ns": last_failure_ns,
+                "last_failure_time": (
+                    last_failure_ns / 1_000_000_000 if last_failure_ns is not None else None
+                ),
+                "last_state_change": self._last_state_change_ns / 1_000_000_000,
+                "router_id": self.router_id,
+            }
 
     async def execute(
         self,
@@ -164,7 +251,8 @@ class CircuitBreaker:
             CircuitOpenError: If circuit is open and no fallback provided.
             Exception: Any exception raised by fn() is re-raised after recording failure.
         """
-        if not self.allow_request():
+        allowed, is_probe = self._admit()
+        if not allowed:
             if fallback is not None:
                 return await fallback()
             raise CircuitOpenError(
@@ -174,11 +262,16 @@ class CircuitBreaker:
 
         try:
             result = await fn()
-            self.record_success()
-            return result
-        except Exception as e:
+        except Exception:
             self.record_failure()
             raise
+        except BaseException:
+            # Cancelled before an outcome: don't strand the probe slot
+            if is_probe:
+                self.release_probe()
+            raise
+        self.record_success()
+        return result
 
 
 # =============================================================================
@@ -377,7 +470,7 @@ class EnhancedCircuitBreaker:
         """Return current circuit breaker statistics."""
         self._prune_old_requests()
         return {
-            "state": self._state.value,
+            "state": self._state.label,
             "failure_rate": self.failure_rate(),
             "request_count": len(self._request_history),
             "failure_count": self.failure_count_in_window(),
@@ -78,7 +78,7 @@ def check_circuit_breaker(model_id: str) -> Tuple[bool, Optional[str]]:
     if breaker.allow_request():
         return True, None
     else:
-        return False, f"Circuit breaker open for {model_id} (state: {breaker.state.value})"
+        return False, f"Circuit breaker open for {model_id} (state: {breaker.state.label})"
 
 
 def record_model_result(model_id: str, success: bool) -> None:
@@ -129,7 +129,7 @@ def _emit_state_change_event(
                     "failure_rate": breaker.failure_rate(),
                     "request_count": breaker.request_count_in_window(),
                     "cooldown_seconds": breaker.config.cooldown_seconds,
-                    "from_state": old_state.value,
+                    "from_state": old_state.label,
                 },
             )
             logger.warning(
@@ -142,7 +142,7 @@ def _emit_state_change_event(
                 LayerEventType.L4_CIRCUIT_BREAKER_CLOSE,
                 {
                     "model_id": breaker.model_id,
-                    "from_state": old_state.value,
+                    "from_state": old_state.label,
                 },
             )
             logger.info(
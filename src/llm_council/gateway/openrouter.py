@@ -25,7 +25,23 @@ def _get_openrouter_api_key() -> str:
     return get_api_key("openrouter") or ""
 
 
-OPENROUTER_API_KEY = _get_openrouter_api_key()
+# Module-level alias for backwards compatibility with tests. Resolved on first
+# access rather than at import, since the ADR-013 lookup may hit the OS keychain.
+def __getattr__(name: str) -> Any:
+    """Resolve the OPENROUTER_API_KEY alias lazily and memoize it (PEP 562)."""
+    if name == "OPENROUTER_API_KEY":
+        value = globals()[name] = _get_openrouter_api_key()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _openrouter_api_key() -> str:
+    """Return the OPENROUTER_API_KEY alias, honouring patches on the module."""
+    try:
+        return globals()["OPENROUTER_API_KEY"]
+    except KeyError:
+        return __getattr__("OPENROUTER_API_KEY")
+
 
 from .base import (
     BaseRouter,
@@ -114,7 +130,7 @@ class OpenRouterGateway(BaseRouter):
             base_url: Base URL for OpenRouter API. If None, uses OPENROUTER_API_URL.
             default_timeout: Default request timeout in seconds.
         """
-        self._api_key = api_key or OPENROUTER_API_KEY
+        self._api_key = api_key or _openrouter_api_key()
         self._base_url = base_url or OPENROUTER_API_URL
         self._default_timeout = default_timeout
         self._capabilities = RouterCapabilities(
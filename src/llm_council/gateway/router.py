@@ -163,7 +163,8 @@ class GatewayRouter:
                 )
 
             # Check circuit breaker
-            if not cb.allow_request():
+            allowed, is_probe = cb._admit()
+            if not allowed:
                 # If circuit is open, we consider this a "failure" contextually
                 # (unavailable) and move to next fallback
                 last_exception = CircuitOpenError(
@@ -221,6 +222,10 @@ class GatewayRouter:
                 cb.record_failure()
                 last_exception = e
                 continue
+            finally:
+                # Free the HALF_OPEN probe slot on statuses that record nothing
+                if is_probe:
+                    cb.release_probe()
 
         # If we get here, all gateways failed
         if last_exception:
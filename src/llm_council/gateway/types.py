@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ..reasoning import ReasoningConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """A content block within a message.
 
@@ -26,7 +26,7 @@ class ContentBlock:
     tool_use: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalMessage:
     """Provider-agnostic message format.
 
@@ -40,7 +40,7 @@ class CanonicalMessage:
     tool_call_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UsageInfo:
     """Token usage information from an API response."""
 
@@ -49,7 +49,7 @@ class UsageInfo:
     total_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningParams:
     """Reasoning parameters for OpenRouter API (ADR-026 Phase 2).
 
@@ -86,7 +86,7 @@ class ReasoningParams:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GatewayRequest:
     """Request to send to a gateway router.
 
@@ -104,7 +104,7 @@ class GatewayRequest:
     reasoning_params: Optional[ReasoningParams] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GatewayResponse:
     """Response from a gateway router.
 
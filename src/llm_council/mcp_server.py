@@ -11,9 +11,12 @@ Implements ADR-012: MCP Server Reliability and Long-Running Operation Handling
 """
 
 import json
+import logging
 import time
 import asyncio
-from typing import List, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP, Context
 
@@ -36,6 +39,24 @@ from llm_council.unified_config import get_config, get_api_key
 from llm_council.tier_contract import create_tier_contract
 from llm_council.openrouter import query_model_with_status, STATUS_OK
 
+logger = logging.getLogger(__name__)
+
+# Optional orjson import - faster JSON encoding when installed
+orjson = None
+try:
+    import orjson as _orjson_module
+
+    orjson = _orjson_module
+except ImportError:
+    pass  # orjson not installed - fall back to stdlib json
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 def _get_council_models() -> list:
     """Get council models from unified config."""
@@ -87,9 +108,30 @@ def get_key_source() -> str:
 # Module-level aliases for backwards compatibility
 COUNCIL_MODELS = _get_council_models()
 CHAIRMAN_MODEL = _get_chairman_model()
-OPENROUTER_API_KEY = _get_openrouter_api_key()
 TIER_MODEL_POOLS = _get_tier_model_pools()
 
+# Aliases whose resolution is expensive (ADR-013 key lookup may hit the OS
+# keychain) are resolved on first access and then memoized in the module.
+_LAZY_ATTRS = {
+    "OPENROUTER_API_KEY": _get_openrouter_api_key,
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazy module-level aliases on first access (PEP 562)."""
+    if name in _LAZY_ATTRS:
+        value = globals()[name] = _LAZY_ATTRS[name]()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _openrouter_api_key() -> str:
+    """Return the OPENROUTER_API_KEY alias, honouring patches on the module."""
+    try:
+        return globals()["OPENROUTER_API_KEY"]
+    except KeyError:
+        return __getattr__("OPENROUTER_API_KEY")
+
 
 mcp = FastMCP("LLM Council")
 
@@ -128,6 +170,33 @@ def _build_confidence_configs() -> dict:
 CONFIDENCE_CONFIGS = _build_confidence_configs()
 
 
+def _build_confidence_table() -> Dict[str, Tuple[int, int, str]]:
+    """
+    Resolve each confidence level to (total_timeout, per_model_timeout, tier).
+
+    Precomputed so consult_council does a single lookup per call.
+    """
+    return {
+        name: (
+            config.get("total", TIMEOUT_SYNTHESIS_TRIGGER),
+            config.get("per_model", 90),  # Default to high tier
+            name if name in TIER_MODEL_POOLS else "high",
+        )
+        for name, config in CONFIDENCE_CONFIGS.items()
+    }
+
+
+_CONFIDENCE_TABLE = _build_confidence_table()
+
+
+async def _report_progress(ctx: Context, step: int, total: int, message: str) -> None:
+    """Forward a progress update to the MCP client (best-effort)."""
+    try:
+        await ctx.report_progress(step, total, message)
+    except Exception:
+        pass  # Progress reporting is best-effort
+
+
 @mcp.tool()
 async def consult_council(
     query: str,
@@ -142,7 +211,7 @@ async def consult_council(
 
     Args:
         query: The question to ask the council.
-        confidence: Response quality level - "quick" (2 models, ~10s), "balanced" (3 models, ~25s), or "high" (full council, ~45s).
+        confidence: Response quality level - "quick" (2 models, ~10s), "balanced" (3 models, ~25s), "high" (full council, ~45s), or "reasoning". Unknown levels are rejected with a JSON error.
         include_details: If True, includes individual model responses and rankings.
         verdict_type: Type of verdict to render (ADR-025b Jury Mode):
             - "synthesis": Default behavior, unstructured natural language synthesis
@@ -164,21 +233,24 @@ async def consult_council(
     except ValueError:
         verdict_type_enum = VerdictType.SYNTHESIS
     # Get confidence configuration (ADR-012 Section 5: Tier-Sovereign Timeouts)
-    config = CONFIDENCE_CONFIGS.get(confidence, CONFIDENCE_CONFIGS["high"])
-    total_timeout = config.get("total", TIMEOUT_SYNTHESIS_TRIGGER)
-    per_model_timeout = config.get("per_model", 90)  # Default to high tier
+    # Reject typos up front rather than silently running the full council
+    try:
+        total_timeout, per_model_timeout, tier = _CONFIDENCE_TABLE[confidence.lower()]
+    except KeyError:
+        logger.warning(f"consult_council called with unknown confidence level: {confidence!r}")
+        return json.dumps(
+            {
+                "error": f"Unknown confidence level {confidence!r}. "
+                f"Valid levels: {', '.join(_CONFIDENCE_TABLE)}",
+            },
+            indent=2,
+        )
 
     # Create TierContract for tier-appropriate model selection (ADR-022)
-    tier = confidence if confidence in TIER_MODEL_POOLS else "high"
     tier_contract = create_tier_contract(tier)
 
-    # Progress reporting helper that bridges MCP context to council callback
-    async def on_progress(step: int, total: int, message: str):
-        if ctx:
-            try:
-                await ctx.report_progress(step, total, message)
-            except Exception:
-                pass  # Progress reporting is best-effort
+    # Bridge MCP context to the council progress callback; skip entirely without a client
+    on_progress = partial(_report_progress, ctx) if ctx is not None else None
 
     # Run the council with ADR-012, ADR-022, and ADR-025b features:
     # - Tier-sovereign timeouts (per-tier total and per-model)
@@ -187,15 +259,36 @@ async def consult_council(
     # - Fallback synthesis
     # - Per-model status tracking
     # - Jury Mode verdict types (ADR-025b)
-    council_result = await run_council_with_fallback(
-        query,
-        on_progress=on_progress,
-        synthesis_deadline=total_timeout,
-        per_model_timeout=per_model_timeout,
-        tier_contract=tier_contract,
-        verdict_type=verdict_type_enum,
-        include_dissent=include_dissent,
-    )
+    #
+    # The synthesis deadline only bounds the pipeline; fallback synthesis runs
+    # after it. Bound the whole call so a hung upstream can't hang the tool,
+    # allowing one per-model timeout of grace for the fallback synthesis.
+    hard_deadline = total_timeout + per_model_timeout
+    try:
+        # asyncio.wait_for rather than asyncio.timeout (Python 3.10 compatible)
+        council_result = await asyncio.wait_for(
+            run_council_with_fallback(
+                query,
+                on_progress=on_progress,
+                synthesis_deadline=total_timeout,
+                per_model_timeout=per_model_timeout,
+                tier_contract=tier_contract,
+                verdict_type=verdict_type_enum,
+                include_dissent=include_dissent,
+            ),
+            timeout=hard_deadline,
+        )
+    except asyncio.TimeoutError:
+        council_result = {
+            "synthesis": f"Error: Council did not respond within {hard_deadline}s.",
+            "model_responses": {},
+            "metadata": {
+                "status": "timeout",
+                "synthesis_type": "none",
+                "tier": tier,
+                "warning": "Council timed out; no synthesis is available. Try a lower confidence level.",
+            },
+        }
 
     # Extract results from ADR-012 structured response
     synthesis = council_result.get("synthesis", "No response from council.")
@@ -203,12 +296,12 @@ async def consult_council(
     model_responses = council_result.get("model_responses", {})
 
     # Build result with metadata (ADR-012 structured output)
-    result = f"### Chairman's Synthesis\n\n{synthesis}\n"
+    parts: List[str] = [f"### Chairman's Synthesis\n\n{synthesis}\n"]
 
     # Add warning if partial results
     warning = metadata.get("warning")
     if warning:
-        result += f"\n> **Note**: {warning}\n"
+        parts.append(f"\n> **Note**: {warning}\n")
 
     # Add status info
     status = metadata.get("status", "unknown")
@@ -216,85 +309,104 @@ async def consult_council(
     if status != "complete":
         synthesis_type = metadata.get("synthesis_type", "unknown")
         tier_info = f", tier: {tier_used}" if tier_used else ""
-        result += f"\n*Council status: {status} ({synthesis_type} synthesis{tier_info})*\n"
+        parts.append(f"\n*Council status: {status} ({synthesis_type} synthesis{tier_info})*\n")
     elif tier_used:
-        result += f"\n*Tier: {tier_used}*\n"
+        parts.append(f"\n*Tier: {tier_used}*\n")
 
     # ADR-025b: Add verdict result for BINARY/TIE_BREAKER modes
     verdict = metadata.get("verdict")
     if verdict:
-        result += "\n### Verdict\n"
-        result += f"**Decision**: {verdict.get('verdict', 'unknown').upper()}\n"
-        result += f"**Confidence**: {verdict.get('confidence', 0):.0%}\n"
-        result += f"**Rationale**: {verdict.get('rationale', 'No rationale provided')}\n"
+        parts.append("\n### Verdict\n")
+        parts.append(f"**Decision**: {verdict.get('verdict', 'unknown').upper()}\n")
+        parts.append(f"**Confidence**: {verdict.get('confidence', 0):.0%}\n")
+        parts.append(f"**Rationale**: {verdict.get('rationale', 'No rationale provided')}\n")
         if verdict.get("deadlocked"):
-            result += f"\n> *Note: Council was deadlocked. Chairman cast deciding vote.*\n"
+            parts.append(f"\n> *Note: Council was deadlocked. Chairman cast deciding vote.*\n")
         if verdict.get("dissent"):
-            result += f"\n**Dissent**: {verdict.get('dissent')}\n"
+            parts.append(f"\n**Dissent**: {verdict.get('dissent')}\n")
 
     # Add council rankings if available
     aggregate = metadata.get("aggregate_rankings", [])
     if aggregate:
-        result += "\n### Council Rankings\n"
+        parts.append("\n### Council Rankings\n")
         for entry in aggregate[:5]:  # Top 5
             score = entry.get("borda_score", "N/A")
-            result += f"- {entry['model']}: {score}\n"
+            parts.append(f"- {entry['model']}: {score}\n")
 
     # ADR-036: Add quality metrics if available
     quality_metrics = metadata.get("quality_metrics")
     if quality_metrics:
-        result += "\n### Quality Metrics\n"
+        parts.append("\n### Quality Metrics\n")
         core = quality_metrics.get("core", {})
 
         # Consensus Strength Score
         css = core.get("consensus_strength", 0.0)
         css_bar = "█" * int(css * 10) + "░" * (10 - int(css * 10))
-        result += f"- **Consensus Strength**: {css:.2f} [{css_bar}]\n"
+        parts.append(f"- **Consensus Strength**: {css:.2f} [{css_bar}]\n")
 
         # Deliberation Depth Index
         ddi = core.get("deliberation_depth", 0.0)
         ddi_bar = "█" * int(ddi * 10) + "░" * (10 - int(ddi * 10))
-        result += f"- **Deliberation Depth**: {ddi:.2f} [{ddi_bar}]\n"
+        parts.append(f"- **Deliberation Depth**: {ddi:.2f} [{ddi_bar}]\n")
 
         # Synthesis Attribution Score
         sas = core.get("synthesis_attribution", {})
         if sas:
             grounded = "✓" if sas.get("grounded", False) else "✗"
-            result += f"- **Synthesis Grounded**: {grounded} (alignment: {sas.get('max_source_alignment', 0):.2f})\n"
+            parts.append(
+                f"- **Synthesis Grounded**: {grounded} (alignment: {sas.get('max_source_alignment', 0):.2f})\n"
+            )
             if sas.get("hallucination_risk", 0) > 0.3:
-                result += f"  - ⚠️ Hallucination risk: {sas.get('hallucination_risk', 0):.2f}\n"
+                parts.append(f"  - ⚠️ Hallucination risk: {sas.get('hallucination_risk', 0):.2f}\n")
 
         # Quality alerts
         alerts = quality_metrics.get("quality_alerts", [])
         if alerts:
-            result += f"\n**Alerts**: {', '.join(alerts)}\n"
+            parts.append(f"\n**Alerts**: {', '.join(alerts)}\n")
 
     if include_details:
-        result += "\n\n### Council Details\n"
+        parts.append("\n\n### Council Details\n")
 
         # Add per-model status (ADR-012)
-        result += "\n#### Model Status\n"
-        for model, info in model_responses.items():
-            model_short = model.split("/")[-1]
-            status_icon = "✓" if info.get("status") == "ok" else "✗"
-            latency = info.get("latency_ms", 0)
-            result += (
-                f"- {status_icon} {model_short}: {info.get('status', 'unknown')} ({latency}ms)\n"
-            )
+        parts.append("\n#### Model Status\n")
+        parts.extend(
+            f"- {'✓' if info.get('status') == 'ok' else '✗'} {model.rsplit('/', 1)[-1]}: "
+            f"{info.get('status', 'unknown')} ({info.get('latency_ms', 0)}ms)\n"
+            for model, info in model_responses.items()
+        )
 
         # Add Stage 1 details (Individual Responses) - only successful ones
-        result += "\n#### Stage 1: Individual Opinions\n"
-        for model, info in model_responses.items():
-            if info.get("status") == "ok" and info.get("response"):
-                result += f"\n**{model}**:\n{info['response']}\n"
+        parts.append("\n#### Stage 1: Individual Opinions\n")
+        parts.extend(
+            f"\n**{model}**:\n{info['response']}\n"
+            for model, info in model_responses.items()
+            if info.get("status") == "ok" and info.get("response")
+        )
 
         # Add Stage 2 details (Rankings) if available
         label_to_model = metadata.get("label_to_model", {})
         if label_to_model:
-            result += "\n#### Stage 2: Peer Review\n"
-            result += f"*Label mappings: {json.dumps(label_to_model)}*\n"
+            parts.append("\n#### Stage 2: Peer Review\n")
+            parts.append(f"*Label mappings: {json.dumps(label_to_model)}*\n")
+
+    return "".join(parts)
 
-    return result
+
+# Invariant part of the health check payload, built once at import
+_HEALTH_TEMPLATE = MappingProxyType(
+    {
+        "council_size": len(COUNCIL_MODELS),
+        "chairman_model": CHAIRMAN_MODEL,
+        "models": tuple(COUNCIL_MODELS),
+        "estimated_duration": MappingProxyType(
+            {
+                "quick": "~20-30 seconds (fastest models)",
+                "balanced": "~45-60 seconds (most models)",
+                "high": f"~60-90 seconds (all {len(COUNCIL_MODELS)} models)",
+            }
+        ),
+    }
+)
 
 
 @mcp.tool()
@@ -308,22 +420,18 @@ async def council_health_check() -> str:
     import os as _os
 
     # Debug: show key prefix and working directory to diagnose key loading issues
-    key_preview = f"{OPENROUTER_API_KEY[:20]}..." if OPENROUTER_API_KEY else None
+    api_key = _openrouter_api_key()
+    key_preview = f"{api_key[:20]}..." if api_key else None
     cwd = _os.getcwd()
 
     checks = {
-        "api_key_configured": bool(OPENROUTER_API_KEY),
+        "api_key_configured": bool(api_key),
         "key_source": get_key_source(),  # ADR-013: Show where key came from
         "key_preview": key_preview,  # Debug: first 20 chars
         "working_directory": cwd,  # Debug: where is .env loaded from?
-        "council_size": len(COUNCIL_MODELS),
-        "chairman_model": CHAIRMAN_MODEL,
-        "models": COUNCIL_MODELS,
-        "estimated_duration": {
-            "quick": "~20-30 seconds (fastest models)",
-            "balanced": "~45-60 seconds (most models)",
-            "high": f"~60-90 seconds (all {len(COUNCIL_MODELS)} models)",
-        },
+        **_HEALTH_TEMPLATE,
+        # Each response gets its own copy of the nested mapping
+        "estimated_duration": dict(_HEALTH_TEMPLATE["estimated_duration"]),
     }
 
     # Quick connectivity test with a fast, cheap model
@@ -363,7 +471,7 @@ async def council_health_check() -> str:
         checks["ready"] = False
         checks["message"] = "OPENROUTER_API_KEY not configured. Set it in environment or .env file."
 
-    return json.dumps(checks, indent=2)
+    return _dumps_indented(checks)
 
 
 @mcp.tool()
@@ -394,19 +502,13 @@ async def verify(
         rationale, and transcript location for audit trail.
     """
     # Report initial progress
-    if ctx:
-        try:
-            await ctx.report_progress(1, 3, "Starting verification...")
-        except Exception:
-            pass  # Progress reporting is best-effort
+    if ctx is not None:
+        await _report_progress(ctx, 1, 3, "Starting verification...")
 
     try:
         # Report verification in progress
-        if ctx:
-            try:
-                await ctx.report_progress(2, 3, "Running council verification...")
-            except Exception:
-                pass
+        if ctx is not None:
+            await _report_progress(ctx, 2, 3, "Running council verification...")
 
         # Create request object and transcript store
         request = VerifyRequest(
@@ -421,11 +523,8 @@ async def verify(
         result = await run_verification(request, store)
 
         # Report completion
-        if ctx:
-            try:
-                await ctx.report_progress(3, 3, "Verification complete")
-            except Exception:
-                pass
+        if ctx is not None:
+            await _report_progress(ctx, 3, 3, "Verification complete")
 
         # Return formatted output for human readability
         # JSON is also included at the end for programmatic parsing
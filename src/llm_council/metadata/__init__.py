@@ -26,6 +26,7 @@ Environment Variables:
 """
 
 import os
+import threading
 from typing import Optional
 
 from .types import (
@@ -59,6 +60,7 @@ from .startup import (
 
 # Global provider instance (singleton)
 _provider: Optional[MetadataProvider] = None
+_provider_lock = threading.Lock()
 
 # Truthy values for model intelligence mode
 _TRUTHY_VALUES = {"true", "1", "yes", "on"}
@@ -83,20 +85,27 @@ def get_provider() -> MetadataProvider:
         MetadataProvider instance
     """
     global _provider
-    if _provider is None:
-        # Offline mode takes precedence
-        if is_offline_mode():
-            _provider = StaticRegistryProvider()
-            check_offline_mode_startup()
-        elif _is_model_intelligence_enabled():
-            # Lazy import to avoid circular dependencies
-            from .dynamic_provider import DynamicMetadataProvider
-
-            _provider = DynamicMetadataProvider()
-        else:
-            _provider = StaticRegistryProvider()
-            check_offline_mode_startup()
-    return _provider
+    provider = _provider
+    if provider is not None:
+        return provider
+
+    # Double-checked: only the first-init race pays for the lock
+    with _provider_lock:
+        if _provider is None:
+            # Offline mode takes precedence
+            if is_offline_mode():
+                provider = StaticRegistryProvider()
+                check_offline_mode_startup()
+            elif _is_model_intelligence_enabled():
+                # Lazy import to avoid circular dependencies
+                from .dynamic_provider import DynamicMetadataProvider
+
+                provider = DynamicMetadataProvider()
+            else:
+                provider = StaticRegistryProvider()
+                check_offline_mode_startup()
+            _provider = provider
+        return _provider
 
 
 def reload_provider() -> None:
@@ -106,7 +115,8 @@ def reload_provider() -> None:
     Useful for testing or when configuration changes.
     """
     global _provider
-    _provider = None
+    with _provider_lock:
+        _provider = None
 
 
 __all__ = [
@@ -20,8 +20,15 @@ def _get_openrouter_api_key() -> str:
     return get_api_key("openrouter") or ""
 
 
-# Module-level alias for backwards compatibility with tests
-OPENROUTER_API_KEY = _get_openrouter_api_key()
+# Module-level alias for backwards compatibility with tests. Resolved on first
+# access rather than at import, since the ADR-013 lookup may hit the OS keychain.
+def __getattr__(name: str) -> Any:
+    """Resolve the OPENROUTER_API_KEY alias lazily and memoize it (PEP 562)."""
+    if name == "OPENROUTER_API_KEY":
+        value = globals()[name] = _get_openrouter_api_key()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if TYPE_CHECKING:
     from llm_council.gateway.types import ReasoningParams
@@ -4,7 +4,6 @@ ADR-036: Consensus Strength Score (CSS)
 Quantifies agreement among council members during Stage 2 peer review.
 """
 
-import statistics
 from typing import List, Tuple, Optional
 import logging
 
@@ -15,6 +15,7 @@ Robustness features (ADR-034 v2.2):
 """
 
 from llm_council.skills.loader import (
+    DEFAULT_DISK_CACHE_PATH,
     DEFAULT_SEARCH_PATHS,
     REFERENCES_DIR,
     SKILL_FILENAME,
@@ -34,6 +35,7 @@ __all__ = [
     "SKILL_FILENAME",
     "REFERENCES_DIR",
     "DEFAULT_SEARCH_PATHS",
+    "DEFAULT_DISK_CACHE_PATH",
     # Exceptions
     "SkillError",
     "SkillNotFoundError",
@@ -12,19 +12,33 @@ Robustness features (ADR-034 v2.2):
 - Thread safety (#294)
 - Cache invalidation (#295)
 - Logging and observability (#296)
+
+Optional on-disk metadata cache keyed by (path, mtime, size) so restarts skip
+re-parsing unchanged SKILL.md files.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
+import tempfile
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader; the pure-Python SafeLoader is much slower
+# when many skills are parsed on a cold cache. PyYAML wheels bundle libyaml on
+# most platforms; otherwise install libyaml before building PyYAML.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Module logger
 logger = logging.getLogger(__name__)
 
@@ -32,6 +46,7 @@ logger = logging.getLogger(__name__)
 SKILL_FILENAME = "SKILL.md"
 REFERENCES_DIR = "references"
 DEFAULT_SEARCH_PATHS = [".github/skills", ".claude/skills"]
+DEFAULT_DISK_CACHE_PATH = Path.home() / ".cache" / "llm-council" / "skills.json"
 
 # Valid skill name pattern: lowercase alphanumeric with hyphens, starting with letter/number
 SKILL_NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*$")
@@ -79,7 +94,7 @@ def _validate_skill_name(skill_name: str) -> None:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Level 1: Skill metadata from YAML frontmatter.
 
@@ -96,29 +111,35 @@ class SkillMetadata:
     domain: Optional[str] = None
     author: Optional[str] = None
     repository: Optional[str] = None
+    # Memoized estimate (cached_property needs __dict__, which slots removes)
+    _estimated_tokens: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def estimated_tokens(self) -> int:
         """Estimate token count for this metadata.
 
-        Uses rough approximation of ~4 characters per token.
+        Uses rough approximation of ~4 characters per token. Computed on
+        first access and cached, as metadata is not modified after loading.
         """
-        text = f"{self.name} {self.description}"
-        if self.license:
-            text += f" {self.license}"
-        if self.compatibility:
-            text += f" {self.compatibility}"
-        if self.allowed_tools:
-            text += f" {' '.join(self.allowed_tools)}"
-        if self.category:
-            text += f" {self.category}"
-        if self.domain:
-            text += f" {self.domain}"
-
-        return len(text) // 4
-
-
-@dataclass
+        if self._estimated_tokens is None:
+            text = f"{self.name} {self.description}"
+            if self.license:
+                text += f" {self.license}"
+            if self.compatibility:
+                text += f" {self.compatibility}"
+            if self.allowed_tools:
+                text += f" {' '.join(self.allowed_tools)}"
+            if self.category:
+                text += f" {self.category}"
+            if self.domain:
+                text += f" {self.domain}"
+
+            self._estimated_tokens = len(text) // 4
+
+        return self._estimated_tokens
+
+
+@dataclass(slots=True)
 class SkillFull:
     """Level 2: Full skill content including body.
 
@@ -141,6 +162,36 @@ FRONTMATTER_PATTERN = re.compile(
     re.DOTALL,
 )
 
+# Bytes variant so loaders can match raw file data and only decode what they use
+_FRONTMATTER_BYTES_PATTERN = re.compile(
+    rb"^---\s*\n(.*?)\n---\s*\n",
+    re.DOTALL,
+)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file bytes with the newline translation of text-mode reads."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _load_frontmatter_yaml(text: str) -> Dict:
+    """Parse the YAML inside the frontmatter delimiters.
+
+    Raises:
+        SkillParseError: If the YAML is invalid or not a mapping
+    """
+    try:
+        frontmatter = yaml.load(text, Loader=_YamlLoader)
+        if not isinstance(frontmatter, dict):
+            raise SkillParseError("YAML frontmatter must be a mapping")
+    except yaml.YAMLError as e:
+        raise SkillParseError(f"Invalid YAML in frontmatter: {e}")
+
+    return frontmatter
+
 
 def _parse_frontmatter(content: str) -> tuple[Dict, str]:
     """Parse YAML frontmatter from skill content.
@@ -158,17 +209,34 @@ def _parse_frontmatter(content: str) -> tuple[Dict, str]:
     if not match:
         raise SkillParseError("SKILL.md must start with YAML frontmatter (--- delimiters)")
 
-    try:
-        frontmatter = yaml.safe_load(match.group(1))
-        if not isinstance(frontmatter, dict):
-            raise SkillParseError("YAML frontmatter must be a mapping")
-    except yaml.YAMLError as e:
-        raise SkillParseError(f"Invalid YAML in frontmatter: {e}")
-
+    frontmatter = _load_frontmatter_yaml(match.group(1))
     body = content[match.end() :].strip()
     return frontmatter, body
 
 
+def _parse_frontmatter_bytes(data: bytes) -> tuple[Dict, int]:
+    """Parse YAML frontmatter from raw SKILL.md bytes.
+
+    Only the frontmatter slice is decoded, so metadata-only loads never
+    decode the body.
+
+    Args:
+        data: Raw SKILL.md file content
+
+    Returns:
+        Tuple of (frontmatter dict, byte offset where the body starts)
+
+    Raises:
+        SkillParseError: If frontmatter is missing or invalid
+    """
+    match = _FRONTMATTER_BYTES_PATTERN.match(data)
+    if not match:
+        raise SkillParseError("SKILL.md must start with YAML frontmatter (--- delimiters)")
+
+    frontmatter = _load_frontmatter_yaml(_decode_text(match.group(1)))
+    return frontmatter, match.end()
+
+
 def _parse_allowed_tools(value: Optional[str]) -> List[str]:
     """Parse allowed-tools string into list.
 
@@ -199,7 +267,15 @@ def load_skill_metadata(content: str) -> SkillMetadata:
         SkillParseError: If content is invalid
     """
     frontmatter, _ = _parse_frontmatter(content)
+    return _metadata_from_dict(frontmatter)
 
+
+def _metadata_from_dict(frontmatter: Dict) -> SkillMetadata:
+    """Build SkillMetadata from a parsed frontmatter mapping.
+
+    Raises:
+        SkillParseError: If required fields are missing
+    """
     # Required fields
     if "name" not in frontmatter:
         raise SkillParseError("SKILL.md frontmatter must include 'name' field")
@@ -239,10 +315,9 @@ def load_skill_full(content: str) -> SkillFull:
         SkillParseError: If content is invalid
     """
     frontmatter, body = _parse_frontmatter(content)
-    metadata = load_skill_metadata(content)
 
     return SkillFull(
-        metadata=metadata,
+        metadata=_metadata_from_dict(frontmatter),
         body=body,
     )
 
@@ -287,17 +362,73 @@ class SkillLoader:
     - Level 3: load_resource() - Reference files
 
     Thread-safe with cache invalidation support (ADR-034 v2.2).
+
+    When ``disk_cache_path`` is set, Level 1 metadata is also persisted across
+    processes, keyed by each SKILL.md's (path, mtime, size). Call close() to
+    write new entries back to disk.
     """
 
-    def __init__(self, skills_dir: Path):
+    def __init__(self, skills_dir: Path, disk_cache_path: Optional[Path] = None):
         """Initialize loader with skills directory.
 
         Args:
             skills_dir: Path to directory containing skill subdirectories
+            disk_cache_path: Optional JSON file for persisting metadata across
+                restarts (e.g. DEFAULT_DISK_CACHE_PATH). Disabled when None.
         """
         self.skills_dir = skills_dir
         self._metadata_cache: Dict[str, SkillMetadata] = {}
         self._lock = threading.RLock()  # Thread safety (#294)
+        self._disk_cache_path = disk_cache_path
+        self._disk_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._disk_cache_dirty = False
+
+    def _load_disk_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the on-disk metadata cache, reading it on first use.
+
+        A missing or unreadable cache file yields an empty cache.
+        Caller must hold ``self._lock``.
+        """
+        if self._disk_cache is None:
+            self._disk_cache = {}
+            if self._disk_cache_path is not None:
+                try:
+                    data = json.loads(self._disk_cache_path.read_bytes())
+                    if isinstance(data, dict):
+                        self._disk_cache = data
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable skill cache {self._disk_cache_path}: {e}")
+        return self._disk_cache
+
+    def _flush_disk_cache(self) -> None:
+        """Atomically write the metadata cache to disk if it changed."""
+        with self._lock:
+            if self._disk_cache_path is None or not self._disk_cache_dirty:
+                return
+
+            cache_path = self._disk_cache_path
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(self._disk_cache, f)
+                    os.replace(temp_path, cache_path)
+                except Exception:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
+                    raise
+                self._disk_cache_dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to write skill cache {cache_path}: {e}")
+
+    def close(self) -> None:
+        """Persist new metadata cache entries to disk (no-op without a disk cache)."""
+        self._flush_disk_cache()
 
     def list_skills(self) -> List[str]:
         """List all available skill names.
@@ -305,13 +436,16 @@ class SkillLoader:
         Returns:
             List of skill directory names that contain SKILL.md
         """
-        if not self.skills_dir.exists():
+        if not self.skills_dir.is_dir():
             return []
 
-        skills = []
-        for item in self.skills_dir.iterdir():
-            if item.is_dir() and (item / SKILL_FILENAME).exists():
-                skills.append(item.name)
+        # scandir's DirEntry.is_dir() reuses the type from readdir, avoiding a stat
+        with os.scandir(self.skills_dir) as entries:
+            skills = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, SKILL_FILENAME))
+            ]
 
         return sorted(skills)
 
@@ -363,11 +497,42 @@ class SkillLoader:
                 return self._metadata_cache[skill_name]
 
         skill_path = self._get_skill_path(skill_name)
-        content = (skill_path / SKILL_FILENAME).read_text(encoding="utf-8")
-        metadata = load_skill_metadata(content)
+        skill_md = skill_path / SKILL_FILENAME
+
+        if self._disk_cache_path is not None:
+            st = skill_md.stat()
+            key = str(skill_md.resolve())
+            with self._lock:
+                entry = self._load_disk_cache().get(key)
+                if (
+                    entry is not None
+                    and entry.get("mtime_ns") == st.st_mtime_ns
+                    and entry.get("size") == st.st_size
+                ):
+                    try:
+                        metadata = SkillMetadata(**entry["metadata"])
+                    except (KeyError, TypeError):
+                        pass  # Stale schema; fall through and re-parse
+                    else:
+                        self._metadata_cache[skill_name] = metadata
+                        logger.debug(f"Loaded metadata from disk cache for: {skill_name}")
+                        return metadata
+
+        data = skill_md.read_bytes()
+        frontmatter, _ = _parse_frontmatter_bytes(data)
+        metadata = _metadata_from_dict(frontmatter)
 
         with self._lock:
             self._metadata_cache[skill_name] = metadata
+            if self._disk_cache_path is not None:
+                self._load_disk_cache()[key] = {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "metadata": {
+                        f.name: getattr(metadata, f.name) for f in fields(metadata) if f.init
+                    },
+                }
+                self._disk_cache_dirty = True
 
         logger.info(f"Successfully loaded skill metadata: {skill_name}")
         return metadata
@@ -388,8 +553,13 @@ class SkillLoader:
         """
         logger.debug(f"Loading full content for skill: {skill_name}")
         skill_path = self._get_skill_path(skill_name)
-        content = (skill_path / SKILL_FILENAME).read_text(encoding="utf-8")
-        return load_skill_full(content)
+        data = (skill_path / SKILL_FILENAME).read_bytes()
+        frontmatter, body_offset = _parse_frontmatter_bytes(data)
+
+        return SkillFull(
+            metadata=_metadata_from_dict(frontmatter),
+            body=_decode_text(data[body_offset:]).strip(),
+        )
 
     def list_resources(self, skill_name: str) -> List[str]:
         """List available Level 3 resources for a skill.
@@ -407,10 +577,11 @@ class SkillLoader:
         skill_path = self._get_skill_path(skill_name)
         refs_dir = skill_path / REFERENCES_DIR
 
-        if not refs_dir.exists():
+        if not refs_dir.is_dir():
             return []
 
-        return sorted([f.name for f in refs_dir.iterdir() if f.is_file()])
+        with os.scandir(refs_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.is_file())
 
     def load_resource(self, skill_name: str, resource_name: str) -> str:
         """Load Level 3 resource content.
@@ -444,6 +615,17 @@ class SkillLoader:
             if skill_name is not None:
                 logger.debug(f"Invalidating cache for skill: {skill_name}")
                 self._metadata_cache.pop(skill_name, None)
+                if self._disk_cache_path is not None:
+                    key = str((self.skills_dir / skill_name / SKILL_FILENAME).resolve())
+                    if self._load_disk_cache().pop(key, None) is not None:
+                        self._disk_cache_dirty = True
             else:
                 logger.debug("Invalidating all cached skill data")
                 self._metadata_cache.clear()
+                if self._disk_cache_path is not None:
+                    # The cache file may be shared; only drop this directory's entries
+                    prefix = str(self.skills_dir.resolve()) + os.sep
+                    disk_cache = self._load_disk_cache()
+                    for key in [k for k in disk_cache if k.startswith(prefix)]:
+                        del disk_cache[key]
+                        self._disk_cache_dirty = True
@@ -1,7 +1,8 @@
 """TierContract dataclass for tier-appropriate council execution (ADR-022).
 
 Defines the contract for each confidence tier, including timeouts, model pools,
-and execution policies. Created per council consultation request.
+and execution policies. Contracts built from the static pools are reused until
+the configuration is reloaded.
 
 ADR-026 Extension: When model intelligence is enabled, uses dynamic model
 selection via select_tier_models() instead of static TIER_MODEL_POOLS.
@@ -11,8 +12,9 @@ with tier-appropriate reasoning parameters for models that support reasoning.
 """
 
 import os
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 # ADR-032: Migrated to unified_config (lazy import to avoid circular dependency)
 
@@ -107,6 +109,48 @@ TIER_AGGREGATORS: Dict[str, str] = {
 }
 
 
+# Tier-specific execution policies per ADR-022. Override policies are read-only
+# mappings so every contract for a tier shares them instead of copying.
+_TIER_POLICIES: Dict[str, Dict[str, Any]] = {
+    "quick": {
+        "token_budget": 2048,
+        "max_attempts": 1,
+        "requires_peer_review": False,  # Quick skips full peer review
+        "requires_verifier": True,  # Uses lightweight verifier instead
+        "override_policy": MappingProxyType({"can_escalate": True, "can_deescalate": False}),
+    },
+    "balanced": {
+        "token_budget": 4096,
+        "max_attempts": 2,
+        "requires_peer_review": True,
+        "requires_verifier": False,
+        "override_policy": MappingProxyType({"can_escalate": True, "can_deescalate": True}),
+    },
+    "high": {
+        "token_budget": 4096,
+        "max_attempts": 3,
+        "requires_peer_review": True,
+        "requires_verifier": False,
+        "override_policy": MappingProxyType({"can_escalate": True, "can_deescalate": True}),
+    },
+    "reasoning": {
+        "token_budget": 8192,
+        "max_attempts": 2,
+        "requires_peer_review": True,
+        "requires_verifier": False,
+        "override_policy": MappingProxyType({"can_escalate": False, "can_deescalate": True}),
+    },
+    # ADR-027: Frontier tier for cutting-edge/preview models
+    "frontier": {
+        "token_budget": 8192,  # Allow large responses
+        "max_attempts": 2,  # Limited retries (preview APIs less stable)
+        "requires_peer_review": True,
+        "requires_verifier": False,
+        "override_policy": MappingProxyType({"can_escalate": False, "can_deescalate": True}),
+    },
+}
+
+
 @dataclass(frozen=True)
 class TierContract:
     """Immutable contract defining tier execution parameters.
@@ -123,6 +167,9 @@ class TierContract:
     - aggregator_model: Model used for synthesis/aggregation
     - override_policy: Escalation/de-escalation rules
     - reasoning_config: Optional reasoning parameters (ADR-026 Phase 2)
+
+    Lists and dicts passed for allowed_models/override_policy are stored as a
+    tuple and a read-only mapping, so contracts are truly immutable and hashable.
     """
 
     tier: str
@@ -132,11 +179,19 @@ class TierContract:
     max_attempts: int
     requires_peer_review: bool
     requires_verifier: bool
-    allowed_models: List[str]
+    allowed_models: Tuple[str, ...]
     aggregator_model: str
-    override_policy: Dict[str, bool]
+    override_policy: Mapping[str, bool] = field(hash=False)
     reasoning_config: Optional["ReasoningConfig"] = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.allowed_models, tuple):
+            object.__setattr__(self, "allowed_models", tuple(self.allowed_models))
+        if not isinstance(self.override_policy, MappingProxyType):
+            object.__setattr__(
+                self, "override_policy", MappingProxyType(dict(self.override_policy))
+            )
+
 
 def _is_model_intelligence_enabled() -> bool:
     """Check if model intelligence (dynamic selection) is enabled."""
@@ -165,6 +220,12 @@ def _get_allowed_models(tier: str, task_domain: Optional[str] = None) -> List[st
     return pools[tier]
 
 
+# Contracts built from static pools, keyed by tier, for the config instance in
+# _static_contract_config
+_static_contract_cache: Dict[str, TierContract] = {}
+_static_contract_config: Optional[object] = None
+
+
 def create_tier_contract(
     tier: str,
     task_domain: Optional[str] = None,
@@ -183,8 +244,36 @@ def create_tier_contract(
     Raises:
         ValueError: If tier is not recognized
     """
+    global _static_contract_config
+
     tier_lower = tier.lower()
 
+    # Dynamic selection (ADR-026) can change between calls, so always rebuild
+    if _is_model_intelligence_enabled():
+        return _build_tier_contract(tier, tier_lower, task_domain)
+
+    # Static pools and timeouts are fixed for a given config instance; reuse
+    # contracts until reload_config() swaps it out
+    from .unified_config import get_config
+
+    config = get_config()
+    if config is not _static_contract_config:
+        _static_contract_cache.clear()
+        _static_contract_config = config
+
+    contract = _static_contract_cache.get(tier_lower)
+    if contract is None:
+        contract = _build_tier_contract(tier, tier_lower, task_domain)
+        _static_contract_cache[tier_lower] = contract
+    return contract
+
+
+def _build_tier_contract(
+    tier: str,
+    tier_lower: str,
+    task_domain: Optional[str],
+) -> TierContract:
+    """Build a TierContract for a normalized tier name."""
     pools = _get_tier_model_pools()
     if tier_lower not in pools:
         raise ValueError(
@@ -196,47 +285,7 @@ def create_tier_contract(
     deadline_ms = timeout_config["total"] * 1000
     per_model_timeout_ms = timeout_config["per_model"] * 1000
 
-    # Tier-specific configurations per ADR-022
-    tier_configs = {
-        "quick": {
-            "token_budget": 2048,
-            "max_attempts": 1,
-            "requires_peer_review": False,  # Quick skips full peer review
-            "requires_verifier": True,  # Uses lightweight verifier instead
-            "override_policy": {"can_escalate": True, "can_deescalate": False},
-        },
-        "balanced": {
-            "token_budget": 4096,
-            "max_attempts": 2,
-            "requires_peer_review": True,
-            "requires_verifier": False,
-            "override_policy": {"can_escalate": True, "can_deescalate": True},
-        },
-        "high": {
-            "token_budget": 4096,
-            "max_attempts": 3,
-            "requires_peer_review": True,
-            "requires_verifier": False,
-            "override_policy": {"can_escalate": True, "can_deescalate": True},
-        },
-        "reasoning": {
-            "token_budget": 8192,
-            "max_attempts": 2,
-            "requires_peer_review": True,
-            "requires_verifier": False,
-            "override_policy": {"can_escalate": False, "can_deescalate": True},
-        },
-        # ADR-027: Frontier tier for cutting-edge/preview models
-        "frontier": {
-            "token_budget": 8192,  # Allow large responses
-            "max_attempts": 2,  # Limited retries (preview APIs less stable)
-            "requires_peer_review": True,
-            "requires_verifier": False,
-            "override_policy": {"can_escalate": False, "can_deescalate": True},
-        },
-    }
-
-    config = tier_configs[tier_lower]
+    config = _TIER_POLICIES[tier_lower]
 
     # Get allowed models - uses dynamic selection if intelligence enabled (ADR-026)
     allowed_models = _get_allowed_models(tier_lower, task_domain)
@@ -260,26 +309,25 @@ def create_tier_contract(
         max_attempts=config["max_attempts"],
         requires_peer_review=config["requires_peer_review"],
         requires_verifier=config["requires_verifier"],
-        allowed_models=allowed_models,
+        allowed_models=tuple(allowed_models),
         aggregator_model=TIER_AGGREGATORS[tier_lower],
         override_policy=config["override_policy"],
         reasoning_config=reasoning_config,
     )
 
 
-# Lazy-loaded default contracts for each tier
-_default_tier_contracts: Optional[Dict[str, TierContract]] = None
+# Tiers covered by the default contracts, built one at a time on first use
+_DEFAULT_TIERS = ("quick", "balanced", "high", "reasoning", "frontier")
+
+
+def get_default_tier_contract(tier: str) -> TierContract:
+    """Get the default contract for a single tier without building the others."""
+    return create_tier_contract(tier.lower())
 
 
 def get_default_tier_contracts() -> Dict[str, TierContract]:
     """Get pre-built default contracts for each tier (lazy-loaded)."""
-    global _default_tier_contracts
-    if _default_tier_contracts is None:
-        _default_tier_contracts = {
-            tier: create_tier_contract(tier)
-            for tier in ["quick", "balanced", "high", "reasoning", "frontier"]
-        }
-    return _default_tier_contracts
+    return {tier: get_default_tier_contract(tier) for tier in _DEFAULT_TIERS}
 
 
 # For backwards compatibility, access via property-like behavior
@@ -37,6 +37,13 @@ from pathlib import Path
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
 import yaml
+
+# Prefer the libyaml-backed loader; same safe semantics, much faster parsing
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator, model_validator
 
 from .tier_contract import TierContract, create_tier_contract
@@ -1077,12 +1084,13 @@ def load_config(
     Raises:
         ValueError: If strict=True and configuration is invalid
     """
-    if config_path is None or not config_path.exists():
+    if config_path is None:
         return UnifiedConfig()
 
     try:
-        with open(config_path, "r") as f:
-            raw_config = yaml.safe_load(f)
+        # Read directly instead of probing with exists(): one syscall fewer, and
+        # PyYAML detects the encoding from the raw bytes
+        raw_config = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)
 
         if raw_config is None:
             return UnifiedConfig()
@@ -1096,6 +1104,8 @@ def load_config(
         # Build config from YAML
         return UnifiedConfig(**council_config)
 
+    except FileNotFoundError:
+        return UnifiedConfig()
     except yaml.YAMLError as e:
         if strict:
             raise ValueError(f"Invalid YAML: {e}")
@@ -1134,6 +1144,15 @@ def _find_config_file() -> Optional[Path]:
     return None
 
 
+# Accepted spellings for boolean environment variables
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _is_truthy(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in _TRUTHY_ENV_VALUES
+
+
 def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     """Apply environment variable overrides to configuration.
 
@@ -1164,20 +1183,20 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Triage overrides
     triage_env = os.getenv("LLM_COUNCIL_TRIAGE_ENABLED")
     if triage_env:
-        config_dict.setdefault("triage", {})["enabled"] = triage_env.lower() in ("true", "1", "yes")
+        config_dict.setdefault("triage", {})["enabled"] = _is_truthy(triage_env)
 
     # Wildcard override
     wildcard_env = os.getenv("LLM_COUNCIL_WILDCARD_ENABLED")
     if wildcard_env:
-        config_dict.setdefault("triage", {}).setdefault("wildcard", {})["enabled"] = (
-            wildcard_env.lower() in ("true", "1", "yes")
+        config_dict.setdefault("triage", {}).setdefault("wildcard", {})["enabled"] = _is_truthy(
+            wildcard_env
         )
 
     # Prompt optimization override
     prompt_opt_env = os.getenv("LLM_COUNCIL_PROMPT_OPTIMIZATION_ENABLED")
     if prompt_opt_env:
         config_dict.setdefault("triage", {}).setdefault("prompt_optimization", {})["enabled"] = (
-            prompt_opt_env.lower() in ("true", "1", "yes")
+            _is_truthy(prompt_opt_env)
         )
 
     # Gateway fallback chain
@@ -1211,11 +1230,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Webhook overrides (ADR-025a)
     webhooks_enabled = os.getenv("LLM_COUNCIL_WEBHOOKS_ENABLED")
     if webhooks_enabled:
-        config_dict.setdefault("webhooks", {})["enabled"] = webhooks_enabled.lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        config_dict.setdefault("webhooks", {})["enabled"] = _is_truthy(webhooks_enabled)
     webhook_timeout = os.getenv("LLM_COUNCIL_WEBHOOK_TIMEOUT")
     if webhook_timeout:
         config_dict.setdefault("webhooks", {})["timeout_seconds"] = float(webhook_timeout)
@@ -1226,15 +1241,15 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Model Intelligence overrides (ADR-026)
     model_intelligence_enabled = os.getenv("LLM_COUNCIL_MODEL_INTELLIGENCE")
     if model_intelligence_enabled:
-        config_dict.setdefault("model_intelligence", {})["enabled"] = (
-            model_intelligence_enabled.lower() in ("true", "1", "yes")
+        config_dict.setdefault("model_intelligence", {})["enabled"] = _is_truthy(
+            model_intelligence_enabled
         )
 
     # Reasoning optimization overrides (ADR-026 Phase 2)
     reasoning_enabled = os.getenv("LLM_COUNCIL_REASONING_ENABLED")
     if reasoning_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("reasoning", {})["enabled"] = (
-            reasoning_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(reasoning_enabled)
         )
 
     # Scoring overrides (ADR-030)
@@ -1249,7 +1264,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     if circuit_breaker_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("circuit_breaker", {})[
             "enabled"
-        ] = circuit_breaker_enabled.lower() in ("true", "1", "yes")
+        ] = _is_truthy(circuit_breaker_enabled)
 
     circuit_threshold = os.getenv("LLM_COUNCIL_CIRCUIT_THRESHOLD")
     if circuit_threshold:
@@ -1267,7 +1282,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     discovery_enabled = os.getenv("LLM_COUNCIL_DISCOVERY_ENABLED")
     if discovery_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("discovery", {})["enabled"] = (
-            discovery_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(discovery_enabled)
         )
 
     discovery_interval = os.getenv("LLM_COUNCIL_DISCOVERY_INTERVAL")
@@ -1286,7 +1301,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     metrics_enabled = os.getenv("LLM_COUNCIL_METRICS_ENABLED")
     if metrics_enabled:
         config_dict.setdefault("observability", {}).setdefault("metrics", {})["enabled"] = (
-            metrics_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(metrics_enabled)
         )
 
     metrics_backend = os.getenv("LLM_COUNCIL_METRICS_BACKEND")
@@ -1311,7 +1326,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     audition_enabled = os.getenv("LLM_COUNCIL_AUDITION_ENABLED")
     if audition_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("audition", {})["enabled"] = (
-            audition_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(audition_enabled)
         )
 
     audition_max_seats = os.getenv("LLM_COUNCIL_AUDITION_MAX_SEATS")
@@ -1335,32 +1350,32 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Evaluation overrides (ADR-031)
     rubric_enabled = os.getenv("RUBRIC_SCORING_ENABLED")
     if rubric_enabled:
-        config_dict.setdefault("evaluation", {}).setdefault("rubric", {})["enabled"] = (
-            rubric_enabled.lower() in ("true", "1", "yes")
+        config_dict.setdefault("evaluation", {}).setdefault("rubric", {})["enabled"] = _is_truthy(
+            rubric_enabled
         )
 
     accuracy_ceiling_enabled = os.getenv("ACCURACY_CEILING_ENABLED")
     if accuracy_ceiling_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("rubric", {})[
             "accuracy_ceiling_enabled"
-        ] = accuracy_ceiling_enabled.lower() in ("true", "1", "yes")
+        ] = _is_truthy(accuracy_ceiling_enabled)
 
     safety_enabled = os.getenv("SAFETY_GATE_ENABLED")
     if safety_enabled:
-        config_dict.setdefault("evaluation", {}).setdefault("safety", {})["enabled"] = (
-            safety_enabled.lower() in ("true", "1", "yes")
+        config_dict.setdefault("evaluation", {}).setdefault("safety", {})["enabled"] = _is_truthy(
+            safety_enabled
         )
 
     bias_audit_enabled = os.getenv("BIAS_AUDIT_ENABLED")
     if bias_audit_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("bias", {})["audit_enabled"] = (
-            bias_audit_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(bias_audit_enabled)
         )
 
     bias_persistence_enabled = os.getenv("BIAS_PERSISTENCE_ENABLED")
     if bias_persistence_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("bias", {})["persistence_enabled"] = (
-            bias_persistence_enabled.lower() in ("true", "1", "yes")
+            _is_truthy(bias_persistence_enabled)
         )
 
     # ADR-032: Council configuration overrides
@@ -1378,8 +1393,8 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
 
     council_exclude_self = os.getenv("LLM_COUNCIL_EXCLUDE_SELF_VOTES")
     if council_exclude_self:
-        config_dict.setdefault("council", {})["exclude_self_votes"] = (
-            council_exclude_self.lower() in ("true", "1", "yes")
+        config_dict.setdefault("council", {})["exclude_self_votes"] = _is_truthy(
+            council_exclude_self
         )
 
     council_style_norm = os.getenv("LLM_COUNCIL_STYLE_NORMALIZATION")
@@ -1387,8 +1402,8 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
         if council_style_norm.lower() == "auto":
             config_dict.setdefault("council", {})["style_normalization"] = "auto"
         else:
-            config_dict.setdefault("council", {})["style_normalization"] = (
-                council_style_norm.lower() in ("true", "1", "yes")
+            config_dict.setdefault("council", {})["style_normalization"] = _is_truthy(
+                council_style_norm
             )
 
     council_normalizer = os.getenv("LLM_COUNCIL_NORMALIZER_MODEL")
@@ -1407,11 +1422,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # ADR-032: Cache configuration overrides
     cache_enabled = os.getenv("LLM_COUNCIL_CACHE")
     if cache_enabled:
-        config_dict.setdefault("cache", {})["enabled"] = cache_enabled.lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        config_dict.setdefault("cache", {})["enabled"] = _is_truthy(cache_enabled)
 
     cache_ttl = os.getenv("LLM_COUNCIL_CACHE_TTL")
     if cache_ttl:
@@ -1601,7 +1612,7 @@ def _get_api_key(provider: str = "openrouter") -> Optional[str]:
     # Normalize provider name to uppercase for env var lookup
     env_var = f"{provider.upper()}_API_KEY"
 
-    # 1. Check environment variable (includes .env via dotenv)
+    # 1. Check environment variable
     key = os.environ.get(env_var)
     if key:
         _key_source = "environment"
@@ -1644,8 +1655,8 @@ def get_api_key(provider: str) -> Optional[str]:
     2. macOS Keychain (via keyring library, if available)
     3. None (caller handles missing key)
 
-    Note: dotenv is loaded at module import, so .env vars
-    are already in os.environ.
+    Note: .env files are not loaded on import; vars from a .env file are
+    only seen if the host process (shell, MCP client) has exported them.
 
     For HTTP handlers with user-provided keys, use set_request_api_key()
     instead of mutating os.environ to avoid race conditions.
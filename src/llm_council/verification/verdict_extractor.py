@@ -7,9 +7,10 @@ council stage outputs for verification results.
 
 from __future__ import annotations
 
+import math
 import re
-import statistics
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
 # Verdict patterns in synthesis text
@@ -27,43 +28,104 @@ REJECTED_PATTERNS = [
     r"\bNOT\s+RECOMMENDED\b",
 ]
 
-# Default rubric dimensions
-RUBRIC_DIMENSIONS = ["accuracy", "relevance", "completeness", "conciseness", "clarity"]
+# Default rubric dimensions (immutable so _DIMENSION_INDEX cannot drift out of sync)
+RUBRIC_DIMENSIONS = ("accuracy", "relevance", "completeness", "conciseness", "clarity")
+_DIMENSION_INDEX = {name: i for i, name in enumerate(RUBRIC_DIMENSIONS)}
 
 
-def extract_verdict_from_synthesis(
-    stage3_result: Dict[str, Any],
-) -> Tuple[str, float]:
-    """
-    Extract verdict and base confidence from Stage 3 synthesis.
+# Blocking issue markers: "CRITICAL:", "MAJOR:", "MINOR:" followed by description
+_ISSUE_PATTERN = r"(?P<severity>CRITICAL|MAJOR|MINOR)[:\s]+(?P<description>[^\n]+)"
+_LOCATION_RE = re.compile(r"(?:in|at)\s+([^\s]+\.py:\d+|\S+\.py)")
 
-    Analyzes the chairman's synthesis to determine if the council
-    approved or rejected the verification target.
 
-    Args:
-        stage3_result: Stage 3 result with 'response' key
+# First letters of every verdict/issue marker above; keep in sync when adding patterns
+_MARKER_INITIALS = "ACDFMNPR"
 
-    Returns:
-        Tuple of (verdict, base_confidence)
-        - verdict: "pass", "fail", or "unclear"
-        - base_confidence: 0.0-1.0 based on signal strength
-    """
-    response = stage3_result.get("response", "")
-    response_upper = response.upper()
 
-    # Check for explicit verdict markers
-    approved_count = 0
-    rejected_count = 0
+def _compile_synthesis_scanner() -> re.Pattern[str]:
+    """Combine verdict and issue markers into one case-insensitive regex.
 
-    for pattern in APPROVED_PATTERNS:
-        if re.search(pattern, response_upper):
-            approved_count += 1
+    Every branch sits inside a lookahead so nothing is consumed: overlapping
+    markers (RECOMMENDED inside NOT RECOMMENDED) are each reported at their
+    start position, exactly as separate per-pattern scans would see them.
 
-    for pattern in REJECTED_PATTERNS:
-        if re.search(pattern, response_upper):
-            rejected_count += 1
+    A zero-width lookahead cannot seed _sre's literal/charset prefilter, so a
+    single-character class guard runs first and rejects most positions before
+    the full alternation is tried.
+    """
+    branches = [f"(?P<approved{i}>{p})" for i, p in enumerate(APPROVED_PATTERNS)]
+    branches += [f"(?P<rejected{i}>{p})" for i, p in enumerate(REJECTED_PATTERNS)]
+    branches.append(_ISSUE_PATTERN)
+    return re.compile(f"(?=[{_MARKER_INITIALS}])(?=(?:{'|'.join(branches)}))", re.IGNORECASE)
+
+
+_SYNTHESIS_RE = _compile_synthesis_scanner()
+
+# Short syntheses are pre-checked with plain substring search; a miss means no
+# pattern can match, so the regex scan is skipped. Any hit falls through to the
+# regex, which still decides word boundaries.
+_SHORT_SYNTHESIS_CHARS = 4096
+_MARKER_KEYWORDS = (
+    "approved",
+    "pass",
+    "accepted",
+    "recommended",
+    "rejected",
+    "fail",
+    "denied",
+    "critical",
+    "major",
+    "minor",
+)
+
+
+# Non-ASCII letters IGNORECASE matches against ASCII i that casefold() does not
+# reduce to a plain "i": dotted capital I folds to "i\u0307", dotless i stays put.
+# casefold() already handles the other two (long s and the Kelvin sign).
+_IGNORECASE_I_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _may_contain_markers(response: str) -> bool:
+    """Cheap substring pre-check for short text; False means no marker can match."""
+    folded = response.translate(_IGNORECASE_I_FOLDS).casefold()
+    return any(keyword in folded for keyword in _MARKER_KEYWORDS)
+
+
+# Syntheses repeat across retries and cached council results; the scan is pure,
+# so identical text reuses the previous result. Bounded because keys are full texts.
+@lru_cache(maxsize=128)
+def _scan_synthesis(response: str) -> Tuple[int, int, Tuple[Tuple[str, str], ...]]:
+    """Scan synthesis text once for verdict markers and blocking issues.
 
-    # Determine verdict based on pattern matches
+    Returns:
+        Tuple of (approved_count, rejected_count, issues) where the counts are
+        the number of distinct patterns that matched and issues are
+        (severity, description) pairs in order of appearance.
+    """
+    approved: Set[str] = set()
+    rejected: Set[str] = set()
+    issues: List[Tuple[str, str]] = []
+    issue_end = 0
+
+    if len(response) < _SHORT_SYNTHESIS_CHARS and not _may_contain_markers(response):
+        return 0, 0, ()
+
+    for match in _SYNTHESIS_RE.finditer(response):
+        severity = match.group("severity")
+        if severity is None:
+            name = match.lastgroup
+            assert name is not None  # every non-issue branch is a named group
+            (approved if name.startswith("approved") else rejected).add(name)
+        elif match.start() >= issue_end:
+            # A description runs to end of line; markers inside it belong to it
+            issues.append((severity.lower(), match.group("description").strip()))
+            issue_end = match.end("description")
+
+    return len(approved), len(rejected), tuple(issues)
+
+
+def _verdict_from_counts(approved_count: int, rejected_count: int) -> Tuple[str, float]:
+    """Map verdict pattern counts to (verdict, base_confidence)."""
     if approved_count > 0 and rejected_count == 0:
         # Clear approval signal
         confidence = min(0.95, 0.70 + (approved_count * 0.10))
@@ -85,6 +147,47 @@ def extract_verdict_from_synthesis(
         return "unclear", 0.50
 
 
+def _build_blocking_issues(issues: Tuple[Tuple[str, str], ...]) -> List[Dict[str, Any]]:
+    """Turn (severity, description) pairs into blocking issue dictionaries."""
+    result: List[Dict[str, Any]] = []
+    for severity, description in issues:
+        # Try to extract location from description
+        loc_match = _LOCATION_RE.search(description)
+        result.append(
+            {
+                "severity": severity,
+                "description": description,
+                "location": loc_match.group(1) if loc_match else None,
+            }
+        )
+    return result
+
+
+def extract_verdict_from_synthesis(
+    stage3_result: Dict[str, Any],
+) -> Tuple[str, float]:
+    """
+    Extract verdict and base confidence from Stage 3 synthesis.
+
+    Analyzes the chairman's synthesis to determine if the council
+    approved or rejected the verification target.
+
+    Args:
+        stage3_result: Stage 3 result with 'response' key
+
+    Returns:
+        Tuple of (verdict, base_confidence)
+        - verdict: "pass", "fail", or "unclear"
+        - base_confidence: 0.0-1.0 based on signal strength
+    """
+    response = stage3_result.get("response") or ""
+    if not response:
+        return "unclear", 0.50
+
+    approved_count, rejected_count, _ = _scan_synthesis(response)
+    return _verdict_from_counts(approved_count, rejected_count)
+
+
 def extract_rubric_scores_from_rankings(
     stage2_results: List[Dict[str, Any]],
 ) -> Dict[str, Optional[float]]:
@@ -101,18 +204,20 @@ def extract_rubric_scores_from_rankings(
     Returns:
         Dictionary mapping dimension names to scores (0-10) or None
     """
-    dimension_scores: Dict[str, List[float]] = {dim: [] for dim in RUBRIC_DIMENSIONS}
+    # Running per-dimension sums and counts, indexed like RUBRIC_DIMENSIONS
+    dimension_sums = [0.0] * len(RUBRIC_DIMENSIONS)
+    dimension_counts = [0] * len(RUBRIC_DIMENSIONS)
     response_scores: List[float] = []
 
     for ranking in stage2_results:
         # Format 1: Dimension-based rubric_scores (ADR-016 format)
         rubric_scores = ranking.get("rubric_scores", {})
         if isinstance(rubric_scores, dict):
-            for dimension in RUBRIC_DIMENSIONS:
-                if dimension in rubric_scores:
-                    score = rubric_scores[dimension]
-                    if isinstance(score, (int, float)) and 0 <= score <= 10:
-                        dimension_scores[dimension].append(float(score))
+            for dimension, score in rubric_scores.items():
+                index = _DIMENSION_INDEX.get(dimension)
+                if index is not None and isinstance(score, (int, float)) and 0 <= score <= 10:
+                    dimension_sums[index] += score
+                    dimension_counts[index] += 1
 
         # Format 2: Per-response scores in parsed_ranking
         parsed = ranking.get("parsed_ranking", {})
@@ -127,10 +232,9 @@ def extract_rubric_scores_from_rankings(
     result: Dict[str, Optional[float]] = {}
     has_dimension_scores = False
 
-    for dimension in RUBRIC_DIMENSIONS:
-        scores = dimension_scores[dimension]
-        if scores:
-            result[dimension] = round(statistics.mean(scores), 1)
+    for dimension, total, count in zip(RUBRIC_DIMENSIONS, dimension_sums, dimension_counts):
+        if count:
+            result[dimension] = round(total / count, 1)
             has_dimension_scores = True
         else:
             result[dimension] = None
@@ -138,7 +242,7 @@ def extract_rubric_scores_from_rankings(
     # If no dimension scores but we have response scores, derive estimates
     if not has_dimension_scores and response_scores:
         overall = round(max(response_scores), 1)
-        mean_score = statistics.mean(response_scores)
+        mean_score = math.fsum(response_scores) / len(response_scores)
 
         result["accuracy"] = overall
         result["clarity"] = round(mean_score, 1)
@@ -174,10 +278,15 @@ def calculate_confidence_from_agreement(
     if not stage2_results:
         return 0.50  # No reviews = unclear
 
-    all_scores: List[float] = []
+    # Running mean and sum of squared deviations (Welford), so no score list is built
+    score_count = 0
+    mean_score = 0.0
+    squared_deviations = 0.0
     top_responses: List[str] = []
 
     for ranking in stage2_results:
+        score_sources = []
+
         # Handle parsed_ranking in multiple formats
         parsed = ranking.get("parsed_ranking")
 
@@ -194,23 +303,26 @@ def calculate_confidence_from_agreement(
                 top_responses.append(ranking_order[0])
 
             if isinstance(scores, dict):
-                for score in scores.values():
-                    if isinstance(score, (int, float)):
-                        all_scores.append(float(score))
+                score_sources.append(scores.values())
 
         # Collect scores from rubric_scores (dimension-based)
         rubric_scores = ranking.get("rubric_scores", {})
         if isinstance(rubric_scores, dict):
-            for score in rubric_scores.values():
+            score_sources.append(rubric_scores.values())
+
+        for values in score_sources:
+            for score in values:
                 if isinstance(score, (int, float)):
-                    all_scores.append(float(score))
+                    score_count += 1
+                    delta = score - mean_score
+                    mean_score += delta / score_count
+                    squared_deviations += delta * (score - mean_score)
 
-    if not all_scores:
+    if not score_count:
         return 0.50  # No scores = unclear
 
-    # Calculate mean and variance
-    mean_score = statistics.mean(all_scores)
-    variance = statistics.variance(all_scores) if len(all_scores) > 1 else 0
+    # Sample variance
+    variance = squared_deviations / (score_count - 1) if score_count > 1 else 0.0
 
     # Calculate ranking agreement (what % of reviewers agree on #1)
     ranking_agreement = 0.0
@@ -221,36 +333,41 @@ def calculate_confidence_from_agreement(
         most_common_count = counts.most_common(1)[0][1]
         ranking_agreement = most_common_count / len(top_responses)
 
-    # Base confidence on mean score
+    # Base confidence on mean score, clamped to [0.3, 1.0]
     # For "pass": high scores = high confidence
     # For "fail": low scores = high confidence
     if stage3_verdict == "pass":
         # Score of 8+ = high confidence, 5-8 = medium, <5 = low
-        score_confidence = min(1.0, max(0.3, (mean_score - 5) / 5))
+        score_confidence = (mean_score - 5) / 5
     elif stage3_verdict == "fail":
         # Score of 4 or less = high confidence in failure
-        score_confidence = min(1.0, max(0.3, (5 - mean_score) / 5 + 0.5))
+        score_confidence = (5 - mean_score) / 5 + 0.5
     else:
         # Unclear - mid-range confidence
         score_confidence = 0.50
+    score_confidence = (
+        0.3 if score_confidence < 0.3 else 1.0 if score_confidence > 1.0 else score_confidence
+    )
 
-    # Adjust for variance (lower variance = higher confidence)
-    # Max variance reduction is 0.20
-    variance_penalty = min(0.20, variance / 10)
-    confidence = score_confidence - variance_penalty
+    # Adjust for variance (lower variance = higher confidence), at most -0.20
+    variance_penalty = variance / 10
+    if variance_penalty > 0.20:
+        variance_penalty = 0.20
 
     # Adjust for ranking agreement (higher agreement = higher confidence)
     # Up to 15% boost for unanimous agreement
     agreement_boost = ranking_agreement * 0.15
-    confidence += agreement_boost
 
     # Adjust for number of reviewers
     # More reviewers = higher confidence (up to 10% boost)
-    reviewer_boost = min(0.10, len(stage2_results) * 0.02)
-    confidence += reviewer_boost
+    reviewer_boost = len(stage2_results) * 0.02
+    if reviewer_boost > 0.10:
+        reviewer_boost = 0.10
+
+    confidence = score_confidence - variance_penalty + agreement_boost + reviewer_boost
 
     # Clamp to valid range
-    return round(max(0.0, min(1.0, confidence)), 2)
+    return round(0.0 if confidence < 0.0 else 1.0 if confidence > 1.0 else confidence, 2)
 
 
 def extract_blocking_issues(
@@ -267,32 +384,12 @@ def extract_blocking_issues(
     Returns:
         List of blocking issue dictionaries with severity, description, location
     """
-    response = stage3_result.get("response", "")
-    issues: List[Dict[str, Any]] = []
-
-    # Look for critical/major/minor issue patterns
-    # Pattern: "CRITICAL:", "MAJOR:", "MINOR:" followed by description
-    issue_pattern = r"(?P<severity>CRITICAL|MAJOR|MINOR)[:\s]+(?P<description>[^\n]+)"
-
-    for match in re.finditer(issue_pattern, response, re.IGNORECASE):
-        severity = match.group("severity").lower()
-        description = match.group("description").strip()
-
-        # Try to extract location from description
-        location = None
-        loc_match = re.search(r"(?:in|at)\s+([^\s]+\.py:\d+|\S+\.py)", description)
-        if loc_match:
-            location = loc_match.group(1)
-
-        issues.append(
-            {
-                "severity": severity,
-                "description": description,
-                "location": location,
-            }
-        )
+    response = stage3_result.get("response") or ""
+    if not response:
+        return []
 
-    return issues
+    _, _, issues = _scan_synthesis(response)
+    return _build_blocking_issues(issues)
 
 
 def build_verification_result(
@@ -316,8 +413,11 @@ def build_verification_result(
     Returns:
         Verification result dictionary
     """
-    # Extract verdict from synthesis
-    verdict, base_confidence = extract_verdict_from_synthesis(stage3_result)
+    # Scan the synthesis once for verdict markers and blocking issues
+    # Empty or missing synthesis (failed chairman) skips the scan entirely
+    response = stage3_result.get("response") or ""
+    approved_count, rejected_count, issues = _scan_synthesis(response) if response else (0, 0, ())
+    verdict, base_confidence = _verdict_from_counts(approved_count, rejected_count)
 
     # Extract rubric scores from rankings
     rubric_scores = extract_rubric_scores_from_rankings(stage2_results)
@@ -335,7 +435,7 @@ def build_verification_result(
     # Extract blocking issues (only for fail/unclear)
     blocking_issues = []
     if verdict in ("fail", "unclear"):
-        blocking_issues = extract_blocking_issues(stage3_result)
+        blocking_issues = _build_blocking_issues(issues)
 
     # Get rationale from synthesis
     rationale = stage3_result.get("response", "No synthesis available.")
@@ -168,6 +168,30 @@ class TestUsageInfo:
         assert usage.completion_tokens == 50
         assert usage.total_tokens == 150
 
+    def test_usage_info_is_immutable_and_hashable(self):
+        """UsageInfo should be a frozen value type."""
+        from llm_council.gateway.types import UsageInfo
+
+        usage = UsageInfo(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+
+        with pytest.raises(FrozenInstanceError):
+            usage.total_tokens = 0
+        assert hash(usage) == hash(UsageInfo(100, 50, 150))
+
+
+class TestGatewayTypeSlots:
+    """Test gateway types avoid per-instance __dict__."""
+
+    def test_message_types_use_slots(self):
+        """High-volume message types should not carry a __dict__."""
+        from llm_council.gateway.types import CanonicalMessage, ContentBlock
+
+        block = ContentBlock(type="text", text="Hello")
+        message = CanonicalMessage(role="user", content=[block])
+
+        assert not hasattr(block, "__dict__")
+        assert not hasattr(message, "__dict__")
+
 
 class TestRouterCapabilities:
     """Test RouterCapabilities dataclass."""
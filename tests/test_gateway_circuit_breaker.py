@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import AsyncMock, patch
 import asyncio
 
+NS = 1_000_000_000
+
 
 class TestCircuitBreakerStates:
     """Test circuit breaker state machine."""
@@ -22,9 +24,16 @@ class TestCircuitBreakerStates:
         """CircuitState should have CLOSED, OPEN, HALF_OPEN states."""
         from llm_council.gateway.circuit_breaker import CircuitState
 
-        assert CircuitState.CLOSED.value == "closed"
-        assert CircuitState.OPEN.value == "open"
-        assert CircuitState.HALF_OPEN.value == "half_open"
+        assert CircuitState.CLOSED.label == "closed"
+        assert CircuitState.OPEN.label == "open"
+        assert CircuitState.HALF_OPEN.label == "half_open"
+
+    def test_circuit_state_is_int_enum(self):
+        """CircuitState compares as a plain int."""
+        from llm_council.gateway.circuit_breaker import CircuitState
+
+        assert [int(s) for s in CircuitState] == [0, 1, 2]
+        assert isinstance(CircuitState.OPEN, int)
 
 
 class TestCircuitBreakerConfig:
@@ -181,6 +190,89 @@ class TestCircuitBreakerHalfOpen:
         cb.record_failure()
         assert cb.state == CircuitState.OPEN
 
+    def test_half_open_admits_single_probe(self):
+        """Only one request should be admitted while a probe is in flight."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker, CircuitState
+
+        clock = [0]
+        cb = CircuitBreaker(
+            failure_threshold=1, success_threshold=2, timeout_seconds=10, now_fn=lambda: clock[0]
+        )
+
+        cb.record_failure()  # Trip
+        clock[0] = 10 * NS
+
+        assert cb.allow_request() is True  # Probe admitted
+        assert cb.state == CircuitState.HALF_OPEN
+        assert cb.allow_request() is False
+        assert cb.allow_request() is False
+
+        cb.record_success()  # Probe finished, circuit still HALF_OPEN
+        assert cb.state == CircuitState.HALF_OPEN
+        assert cb.allow_request() is True
+
+    def test_release_probe_frees_slot(self):
+        """release_probe() should let the next caller probe."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker
+
+        clock = [0]
+        cb = CircuitBreaker(failure_threshold=1, timeout_seconds=10, now_fn=lambda: clock[0])
+
+        cb.record_failure()
+        clock[0] = 10 * NS
+        assert cb.allow_request() is True
+        assert cb.allow_request() is False
+
+        cb.release_probe()
+        assert cb.allow_request() is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_does_not_strand_slot(self):
+        """A cancelled probe in execute() should release the slot."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker, CircuitState
+
+        clock = [0]
+        cb = CircuitBreaker(failure_threshold=1, timeout_seconds=10, now_fn=lambda: clock[0])
+
+        cb.record_failure()
+        clock[0] = 10 * NS
+
+        async def cancelled_fn():
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cb.execute(cancelled_fn)
+
+        assert cb.state == CircuitState.HALF_OPEN
+        assert cb.allow_request() is True
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_stale_request_keeps_probe_slot(self):
+        """A request admitted while CLOSED must not free the HALF_OPEN probe slot."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker, CircuitState
+
+        clock = [0]
+        cb = CircuitBreaker(failure_threshold=1, timeout_seconds=10, now_fn=lambda: clock[0])
+        started = asyncio.Event()
+
+        async def slow_fn():
+            started.set()
+            await asyncio.Event().wait()
+
+        stale = asyncio.create_task(cb.execute(slow_fn))
+        await started.wait()
+
+        cb.record_failure()  # Trip while the stale request is in flight
+        clock[0] = 10 * NS
+        assert cb.allow_request() is True  # The real probe
+        assert cb.state == CircuitState.HALF_OPEN
+
+        stale.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stale
+
+        assert cb.allow_request() is False
 
 class TestCircuitBreakerMetrics:
     """Test circuit breaker metrics and observability."""
@@ -196,7 +288,7 @@ class TestCircuitBreakerMetrics:
 
         stats = cb.get_stats()
 
-        assert stats["state"] == CircuitState.CLOSED.value
+        assert stats["state"] == "closed"
         assert stats["failure_count"] == 2
         assert stats["success_count"] == 0
         assert "last_failure_time" in stats
@@ -296,3 +388,62 @@ class TestCircuitBreakerWrapper:
 
         result = await cb.execute(mock_fn, fallback=fallback_fn)
         assert result == "fallback"
+
+
+class TestCircuitBreakerClock:
+    """Test injectable clock for the recovery timer."""
+
+    def test_uses_injected_clock_for_recovery(self):
+        """Recovery timeout should be measured with the injected clock."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker, CircuitState
+
+        clock = [100 * NS]
+        cb = CircuitBreaker(failure_threshold=1, timeout_seconds=30, now_fn=lambda: clock[0])
+
+        cb.record_failure()
+        assert cb.state == CircuitState.OPEN
+
+        clock[0] = 130 * NS - 1
+        assert cb.allow_request() is False
+
+        clock[0] = 130 * NS
+        assert cb.allow_request() is True
+        assert cb.state == CircuitState.HALF_OPEN
+
+    def test_explicit_now_overrides_clock(self):
+        """An explicit now argument should be used instead of reading the clock."""
+        from llm_council.gateway.circuit_breaker import CircuitBreaker, CircuitState
+
+        cb = CircuitBreaker(failure_threshold=1, timeout_seconds=30, now_fn=lambda: 0)
+
+        cb.record_failure(now=50 * NS)
+        stats = cb.get_stats()
+        assert stats["last_failure_ns"] == 50 * NS
+        assert stats["last_failure_time"] == 50.0
+        assert cb.allow_request(now=79 * NS) is False
+        assert cb.allow_request(now=80 * NS) is True
+        assert cb.state == CircuitState.HALF_OPEN
+
+
+class TestCircuitBreakerThreadSafety:
+    """Test concurrent access to a shared circuit breaker."""
+
+    def test_concurrent_failures_are_all_counted(self):
+        """Failures recorded from many threads should not be lost."""
+        import threading
+
+        from llm_council.gateway.circuit_breaker import CircuitBreaker
+
+        cb = CircuitBreaker(failure_threshold=10_000)
+
+        def worker():
+            for _ in range(500):
+                cb.record_failure()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cb.failure_count == 4000
@@ -25,6 +25,16 @@ def test_mcp_server_imports():
     assert hasattr(mcp_server, "main")
 
 
+@pytest.mark.asyncio
+async def test_mcp_tools_registered_once():
+    """Each tool should be registered exactly once on the single FastMCP instance."""
+    from llm_council.mcp_server import mcp
+
+    names = [tool.name for tool in await mcp.list_tools()]
+    assert len(names) == len(set(names))
+    assert names.count("consult_council") == 1
+
+
 def test_main_entry_point_exists():
     """Test that main() entry point is defined."""
     from llm_council.mcp_server import main
@@ -46,6 +56,17 @@ def test_confidence_configs_defined():
     assert CONFIDENCE_CONFIGS["high"]["models"] is None  # Use all
 
 
+def test_confidence_table_matches_configs():
+    """Precomputed confidence table should mirror CONFIDENCE_CONFIGS."""
+    from llm_council.mcp_server import CONFIDENCE_CONFIGS, _CONFIDENCE_TABLE
+
+    assert set(_CONFIDENCE_TABLE) == set(CONFIDENCE_CONFIGS)
+    for level, (total, per_model, tier) in _CONFIDENCE_TABLE.items():
+        assert total == CONFIDENCE_CONFIGS[level]["total"]
+        assert per_model == CONFIDENCE_CONFIGS[level]["per_model"]
+        assert tier == level
+
+
 @pytest.mark.asyncio
 async def test_consult_council_tool():
     """Test that consult_council tool is properly defined."""
@@ -77,6 +98,41 @@ async def test_consult_council_tool():
         assert "### Chairman's Synthesis" in result
 
 
+@pytest.mark.asyncio
+async def test_consult_council_rejects_unknown_confidence():
+    """Misspelled confidence levels should error instead of running the full council."""
+    from llm_council.mcp_server import consult_council
+
+    with patch("llm_council.mcp_server.run_council_with_fallback") as mock_council:
+        result = await consult_council("test query", confidence="quik")
+
+    mock_council.assert_not_called()
+    data = json.loads(result)
+    assert "quik" in data["error"]
+    assert "quick" in data["error"]
+
+
+@pytest.mark.asyncio
+async def test_consult_council_bounded_by_tier_deadline():
+    """consult_council should return a timeout result instead of hanging."""
+    import asyncio
+
+    from llm_council.mcp_server import consult_council
+
+    async def hung_council(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with (
+        patch("llm_council.mcp_server.run_council_with_fallback", side_effect=hung_council),
+        patch.dict("llm_council.mcp_server._CONFIDENCE_TABLE", {"quick": (0.01, 0.01, "quick")}),
+    ):
+        result = await consult_council("test query", confidence="quick")
+
+    assert "### Chairman's Synthesis" in result
+    assert "did not respond within" in result
+    assert "Council status: timeout" in result
+
+
 @pytest.mark.asyncio
 async def test_consult_council_with_details():
     """Test consult_council with include_details=True."""
@@ -110,6 +166,31 @@ async def test_consult_council_with_details():
         assert "Stage 2: Peer Review" in result
 
 
+@pytest.mark.asyncio
+async def test_consult_council_details_formatting():
+    """Model status lists every model; Stage 1 only shows successful responses."""
+    from llm_council.mcp_server import consult_council
+
+    mock_result = {
+        "synthesis": "Synthesized response",
+        "model_responses": {
+            "openai/gpt-4o": {"status": "ok", "latency_ms": 1200, "response": "Answer A"},
+            "google/gemini": {"status": "timeout", "latency_ms": 5000},
+        },
+        "metadata": {"status": "partial", "synthesis_type": "partial"},
+    }
+
+    with patch("llm_council.mcp_server.run_council_with_fallback") as mock_council:
+        mock_council.return_value = mock_result
+
+        result = await consult_council("test query", include_details=True)
+
+    assert "- ✓ gpt-4o: ok (1200ms)\n" in result
+    assert "- ✗ gemini: timeout (5000ms)\n" in result
+    assert "\n**openai/gpt-4o**:\nAnswer A\n" in result
+    assert "**google/gemini**" not in result
+
+
 @pytest.mark.asyncio
 async def test_consult_council_with_confidence_level():
     """Test consult_council with confidence level parameter (ADR-012)."""
@@ -182,6 +263,19 @@ async def test_council_health_check_no_api_key():
         assert "not configured" in data["message"].lower()
 
 
+def test_openrouter_api_key_alias_resolved_lazily():
+    """The API key alias is resolved on first access and then memoized."""
+    import llm_council.mcp_server as mcp_server
+
+    mcp_server.__dict__.pop("OPENROUTER_API_KEY", None)
+    with patch("llm_council.mcp_server.get_api_key", return_value="lazy-key") as resolver:
+        assert "OPENROUTER_API_KEY" not in mcp_server.__dict__
+        assert mcp_server.OPENROUTER_API_KEY == "lazy-key"
+        assert mcp_server.OPENROUTER_API_KEY == "lazy-key"
+        assert resolver.call_count == 1
+    mcp_server.__dict__.pop("OPENROUTER_API_KEY", None)
+
+
 @pytest.mark.asyncio
 @pytest.mark.vcr()
 async def test_council_health_check_success():
@@ -238,6 +332,26 @@ async def test_council_health_check_includes_estimates():
         assert "high" in data["estimated_duration"]
 
 
+def test_health_template_is_read_only_throughout():
+    """The shared health template must not expose mutable nested values."""
+    from llm_council.mcp_server import _HEALTH_TEMPLATE
+
+    with pytest.raises(TypeError):
+        _HEALTH_TEMPLATE["estimated_duration"]["quick"] = "instant"
+
+def test_dumps_indented_falls_back_to_stdlib_json():
+    """Health check serialization should work without orjson installed."""
+    from llm_council import mcp_server
+
+    payload = {"ready": True, "models": ("a", "b"), "estimated_duration": {"quick": "~20s"}}
+
+    with patch.object(mcp_server, "orjson", None):
+        result = mcp_server._dumps_indented(payload)
+
+    assert result == json.dumps(payload, indent=2)
+    assert json.loads(mcp_server._dumps_indented(payload)) == json.loads(result)
+
+
 @pytest.mark.asyncio
 async def test_consult_council_with_context_progress():
     """Test that consult_council calls progress reporting when context is provided."""
@@ -276,6 +390,20 @@ async def test_consult_council_with_context_progress():
         assert mock_ctx.report_progress.call_count >= 2
 
 
+@pytest.mark.asyncio
+async def test_consult_council_skips_progress_without_context():
+    """Without an MCP context, no progress callback should be passed to the council."""
+    from llm_council.mcp_server import consult_council
+
+    mock_result = {"synthesis": "Synthesized response", "model_responses": {}, "metadata": {}}
+
+    with patch("llm_council.mcp_server.run_council_with_fallback") as mock_council:
+        mock_council.return_value = mock_result
+        await consult_council("test query")
+
+    assert mock_council.call_args.kwargs["on_progress"] is None
+
+
 @pytest.mark.asyncio
 async def test_consult_council_shows_warning_on_partial():
     """Test that consult_council shows warning when partial results returned (ADR-012)."""
@@ -52,7 +52,7 @@ class TestConsultCouncilWithTierContract:
             call_kwargs = mock_council.call_args.kwargs
             tier_contract = call_kwargs["tier_contract"]
             pools = _get_tier_model_pools()
-            assert tier_contract.allowed_models == pools["quick"]
+            assert tier_contract.allowed_models == tuple(pools["quick"])
 
     @pytest.mark.asyncio
     async def test_high_tier_uses_high_models(self):
@@ -72,7 +72,7 @@ class TestConsultCouncilWithTierContract:
             call_kwargs = mock_council.call_args.kwargs
             tier_contract = call_kwargs["tier_contract"]
             pools = _get_tier_model_pools()
-            assert tier_contract.allowed_models == pools["high"]
+            assert tier_contract.allowed_models == tuple(pools["high"])
 
     @pytest.mark.asyncio
     async def test_reasoning_tier_uses_reasoning_models(self):
@@ -92,7 +92,7 @@ class TestConsultCouncilWithTierContract:
             call_kwargs = mock_council.call_args.kwargs
             tier_contract = call_kwargs["tier_contract"]
             pools = _get_tier_model_pools()
-            assert tier_contract.allowed_models == pools["reasoning"]
+            assert tier_contract.allowed_models == tuple(pools["reasoning"])
 
 
 class TestHealthCheckWithTierPools:
@@ -32,6 +32,42 @@ class TestMetadataProviderFactory:
         provider2 = get_provider()
         assert provider1 is not provider2
 
+    def test_get_provider_concurrent_first_touch_builds_once(self):
+        """Concurrent first calls should share a single provider instance."""
+        import threading
+
+        from llm_council.metadata import get_provider, reload_provider
+        from llm_council.metadata.static_registry import StaticRegistryProvider
+
+        reload_provider()
+        start = threading.Barrier(8)
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(get_provider())
+
+        try:
+            with (
+                patch(
+                    "llm_council.metadata.StaticRegistryProvider", wraps=StaticRegistryProvider
+                ) as mock_cls,
+                patch("llm_council.metadata.check_offline_mode_startup") as mock_check,
+            ):
+                threads = [threading.Thread(target=worker) for _ in range(8)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+            assert len(results) == 8
+            assert all(p is results[0] for p in results)
+            assert mock_cls.call_count == 1
+            assert mock_check.call_count == 1
+        finally:
+            # Don't leak the provider built under the patches into later tests
+            reload_provider()
+
 
 class TestMetadataWithTierConfig:
     """Test metadata integration with tier configuration."""
@@ -218,6 +218,32 @@ class TestKeyringOptional:
         finally:
             unified_config.keyring = original_keyring
 
+    def test_import_does_not_query_keychain(self):
+        """Importing the MCP server should not resolve the API key."""
+        import subprocess
+        import textwrap
+
+        script = textwrap.dedent(
+            """
+            import sys, types
+
+            calls = []
+            fake = types.ModuleType("keyring")
+            fake.get_keyring = lambda: object()
+            fake.get_password = lambda service, name: calls.append(name)
+            sys.modules["keyring"] = fake
+
+            import llm_council.mcp_server
+
+            print(len(calls))
+            """
+        )
+        env = {k: v for k, v in os.environ.items() if k != "OPENROUTER_API_KEY"}
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+        )
+        assert result.stdout.strip() == "0"
+
 
 # =============================================================================
 # Test 4: Config File Warning
@@ -3,8 +3,22 @@
 TDD: Write these tests first, then implement the TierContract.
 """
 
+import os
 import pytest
 from typing import Dict, List
+from unittest.mock import patch
+
+from llm_council import tier_contract
+from llm_council.reasoning import ReasoningConfig, ReasoningEffort
+from llm_council.tier_contract import (
+    DEFAULT_TIER_CONTRACTS,
+    TIER_AGGREGATORS,
+    TierContract,
+    _get_tier_model_pools,
+    create_tier_contract,
+    get_tier_timeout,
+)
+from llm_council.unified_config import reload_config
 
 
 class TestTierContractStructure:
@@ -12,8 +26,6 @@ class TestTierContractStructure:
 
     def test_tier_contract_has_required_fields(self):
         """TierContract must have all ADR-022 council-recommended fields."""
-        from llm_council.tier_contract import TierContract
-
         contract = TierContract(
             tier="high",
             deadline_ms=180000,
@@ -39,8 +51,6 @@ class TestTierContractStructure:
 
     def test_tier_contract_is_immutable(self):
         """TierContract should be a frozen dataclass for safety."""
-        from llm_council.tier_contract import TierContract
-
         contract = TierContract(
             tier="quick",
             deadline_ms=30000,
@@ -57,87 +67,127 @@ class TestTierContractStructure:
         with pytest.raises(Exception):  # FrozenInstanceError
             contract.tier = "high"
 
+    def test_tier_contract_collections_are_immutable_and_hashable(self):
+        """List/dict inputs are stored as tuple and read-only mapping."""
+        models = ["openai/gpt-4o-mini"]
+        contract = TierContract(
+            tier="quick",
+            deadline_ms=30000,
+            per_model_timeout_ms=20000,
+            token_budget=2048,
+            max_attempts=1,
+            requires_peer_review=False,
+            requires_verifier=False,
+            allowed_models=models,
+            aggregator_model="openai/gpt-4o-mini",
+            override_policy={"can_escalate": True, "can_deescalate": False},
+        )
+        models.append("late/addition")
 
-class TestCreateTierContract:
-    """Test create_tier_contract() factory function."""
-
-    def test_create_tier_contract_quick(self):
-        """Quick tier contract has correct defaults."""
-        from llm_council.tier_contract import create_tier_contract
-
-        contract = create_tier_contract("quick")
-
-        assert contract.tier == "quick"
-        assert contract.deadline_ms == 30000  # 30s
-        assert contract.requires_peer_review is False  # Quick skips full peer review
-        assert contract.requires_verifier is True  # Quick uses lightweight verifier
-        assert contract.max_attempts == 1
+        assert contract.allowed_models == ("openai/gpt-4o-mini",)
         assert contract.override_policy["can_escalate"] is True
+        with pytest.raises(TypeError):
+            contract.override_policy["can_escalate"] = False
+        assert {contract: "ok"}[contract] == "ok"
 
-    def test_create_tier_contract_balanced(self):
-        """Balanced tier contract has correct defaults."""
-        from llm_council.tier_contract import create_tier_contract
-
-        contract = create_tier_contract("balanced")
+    def test_factory_contracts_share_tier_override_policy(self):
+        """Contracts for a tier reuse the module-level policy mapping."""
+        expected = tier_contract._TIER_POLICIES["reasoning"]["override_policy"]
 
-        assert contract.tier == "balanced"
-        assert contract.deadline_ms == 90000  # 90s
-        assert contract.requires_peer_review is True
-        assert contract.requires_verifier is False
-        assert contract.max_attempts == 2
-
-    def test_create_tier_contract_high(self):
-        """High tier contract has correct defaults."""
-        from llm_council.tier_contract import create_tier_contract
-
-        contract = create_tier_contract("high")
+        with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
+            contract = create_tier_contract("reasoning")
 
-        assert contract.tier == "high"
-        assert contract.deadline_ms == 180000  # 180s
-        assert contract.requires_peer_review is True
-        assert contract.requires_verifier is False
-        assert contract.max_attempts == 3
+        assert contract.override_policy is expected
+        assert isinstance(contract.allowed_models, tuple)
 
-    def test_create_tier_contract_reasoning(self):
-        """Reasoning tier contract has correct defaults."""
-        from llm_council.tier_contract import create_tier_contract
 
-        contract = create_tier_contract("reasoning")
+class TestCreateTierContract:
+    """Test create_tier_contract() factory function."""
 
-        assert contract.tier == "reasoning"
-        assert contract.deadline_ms == 600000  # 600s
-        assert contract.requires_peer_review is True
-        assert contract.requires_verifier is False
-        assert contract.max_attempts == 2
+    @pytest.mark.parametrize(
+        "tier,deadline_ms,requires_peer_review,requires_verifier,max_attempts,can_escalate",
+        [
+            ("quick", 30000, False, True, 1, True),  # Quick uses lightweight verifier
+            ("balanced", 90000, True, False, 2, True),
+            ("high", 180000, True, False, 3, True),
+            ("reasoning", 600000, True, False, 2, False),
+        ],
+    )
+    def test_create_tier_contract_defaults(
+        self,
+        tier,
+        deadline_ms,
+        requires_peer_review,
+        requires_verifier,
+        max_attempts,
+        can_escalate,
+    ):
+        """Each tier contract has the ADR-022 defaults."""
+        contract = create_tier_contract(tier)
+
+        assert contract.tier == tier
+        assert contract.deadline_ms == deadline_ms
+        assert contract.requires_peer_review is requires_peer_review
+        assert contract.requires_verifier is requires_verifier
+        assert contract.max_attempts == max_attempts
+        assert contract.override_policy["can_escalate"] is can_escalate
 
     def test_create_tier_contract_uses_tier_model_pools(self):
         """Factory function should use tier model pools for allowed_models."""
-        from llm_council.tier_contract import create_tier_contract, _get_tier_model_pools
-
         # Get the actual pools from unified config
         pools = _get_tier_model_pools()
 
         contract = create_tier_contract("quick")
-        assert contract.allowed_models == pools["quick"]
+        assert contract.allowed_models == tuple(pools["quick"])
 
         contract = create_tier_contract("high")
-        assert contract.allowed_models == pools["high"]
+        assert contract.allowed_models == tuple(pools["high"])
 
     def test_create_tier_contract_invalid_tier_raises(self):
         """Invalid tier should raise ValueError."""
-        from llm_council.tier_contract import create_tier_contract
-
         with pytest.raises(ValueError, match="Unknown tier"):
             create_tier_contract("invalid_tier")
 
 
+class TestTierContractCache:
+    """Static-pool contracts are reused until the config is reloaded."""
+
+    def test_static_contract_reused(self):
+        """Static-pool contracts are the same instance across calls, case-insensitively."""
+        with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "false"}):
+            assert create_tier_contract("high") is create_tier_contract("HIGH")
+
+    def test_reload_config_rebuilds_contract(self):
+        """The cache is keyed per config, so a reload yields a new, equal contract."""
+        with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "false"}):
+            before = create_tier_contract("quick")
+            reload_config()
+            after = create_tier_contract("quick")
+
+        assert after is not before
+        assert after == before
+
+    def test_dynamic_selection_not_cached(self):
+        """Model intelligence bypasses the cache and reselects models on each call."""
+        with (
+            patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}),
+            patch(
+                "llm_council.metadata.selection.select_tier_models",
+                side_effect=[["model-a"], ["model-b"]],
+            ),
+        ):
+            first = create_tier_contract("balanced")
+            second = create_tier_contract("balanced")
+
+        assert first.allowed_models == ("model-a",)
+        assert second.allowed_models == ("model-b",)
+
+
 class TestTierAggregators:
     """Test tier-appropriate aggregator models (ADR-022 council recommendation)."""
 
     def test_tier_aggregators_mapping_exists(self):
         """TIER_AGGREGATORS mapping should exist."""
-        from llm_council.tier_contract import TIER_AGGREGATORS
-
         assert isinstance(TIER_AGGREGATORS, dict)
         assert "quick" in TIER_AGGREGATORS
         assert "balanced" in TIER_AGGREGATORS
@@ -146,32 +196,24 @@ class TestTierAggregators:
 
     def test_quick_tier_uses_fast_aggregator(self):
         """Quick tier should use a fast model for aggregation."""
-        from llm_council.tier_contract import TIER_AGGREGATORS
-
         aggregator = TIER_AGGREGATORS["quick"]
         # Should be a mini/flash model
         assert any(fast in aggregator.lower() for fast in ["mini", "flash", "haiku"])
 
     def test_balanced_tier_uses_mid_aggregator(self):
         """Balanced tier should use a mid-tier model for aggregation."""
-        from llm_council.tier_contract import TIER_AGGREGATORS
-
         aggregator = TIER_AGGREGATORS["balanced"]
         # Should be a capable but not premium model
         assert "gpt-4o" in aggregator or "sonnet" in aggregator.lower()
 
     def test_reasoning_tier_uses_capable_aggregator(self):
         """Reasoning tier needs aggregator that understands o1 outputs."""
-        from llm_council.tier_contract import TIER_AGGREGATORS
-
         aggregator = TIER_AGGREGATORS["reasoning"]
         # Should be Claude Opus or similar (can understand chain-of-thought)
         assert "opus" in aggregator.lower() or "gpt-4o" in aggregator
 
     def test_create_tier_contract_uses_tier_aggregators(self):
         """Factory function should use TIER_AGGREGATORS for aggregator_model."""
-        from llm_council.tier_contract import create_tier_contract, TIER_AGGREGATORS
-
         for tier in ["quick", "balanced", "high", "reasoning"]:
             contract = create_tier_contract(tier)
             assert contract.aggregator_model == TIER_AGGREGATORS[tier]
@@ -182,8 +224,6 @@ class TestTierContractDefaults:
 
     def test_default_tier_contracts_exists(self):
         """DEFAULT_TIER_CONTRACTS should be available for reference."""
-        from llm_council.tier_contract import DEFAULT_TIER_CONTRACTS
-
         assert isinstance(DEFAULT_TIER_CONTRACTS, dict)
         assert "quick" in DEFAULT_TIER_CONTRACTS
         assert "balanced" in DEFAULT_TIER_CONTRACTS
@@ -192,54 +232,43 @@ class TestTierContractDefaults:
 
     def test_all_tier_contracts_are_tier_contract_instances(self):
         """All default contracts should be TierContract instances."""
-        from llm_council.tier_contract import DEFAULT_TIER_CONTRACTS, TierContract
-
         for tier, contract in DEFAULT_TIER_CONTRACTS.items():
             assert isinstance(contract, TierContract), f"{tier} should be TierContract"
 
+    def test_get_default_tier_contract_builds_only_requested_tier(self):
+        """Single-tier accessor should not build every default contract."""
+        with patch.object(
+            tier_contract, "create_tier_contract", wraps=tier_contract.create_tier_contract
+        ) as spy:
+            contract = tier_contract.get_default_tier_contract("Balanced")
 
-class TestTierContractTimeoutAlignment:
-    """Test that TierContract timeouts align with ADR-012 tier timeouts."""
-
-    def test_quick_timeout_matches_adr012(self):
-        """Quick tier deadline should match ADR-012 (30s)."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.tier_contract import get_tier_timeout
-
-        contract = create_tier_contract("quick")
-        tier_timeout = get_tier_timeout("quick")
-
-        assert contract.deadline_ms == tier_timeout["total"] * 1000
-
-    def test_balanced_timeout_matches_adr012(self):
-        """Balanced tier deadline should match ADR-012 (90s)."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.tier_contract import get_tier_timeout
-
-        contract = create_tier_contract("balanced")
-        tier_timeout = get_tier_timeout("balanced")
-
-        assert contract.deadline_ms == tier_timeout["total"] * 1000
-
-    def test_high_timeout_matches_adr012(self):
-        """High tier deadline should match ADR-012 (180s)."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.tier_contract import get_tier_timeout
+        assert contract.tier == "balanced"
+        spy.assert_called_once_with("balanced")
 
-        contract = create_tier_contract("high")
-        tier_timeout = get_tier_timeout("high")
+    def test_get_default_tier_contract_follows_config_reload(self):
+        """Default contracts come from the config-keyed cache, so reloads apply."""
+        with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "false"}):
+            before = tier_contract.get_default_tier_contract("quick")
+            assert before is create_tier_contract("quick")
+            reload_config()
+            after = tier_contract.get_default_tier_contract("quick")
 
-        assert contract.deadline_ms == tier_timeout["total"] * 1000
+        assert after is not before
+        assert after is create_tier_contract("quick")
 
-    def test_reasoning_timeout_matches_adr012(self):
-        """Reasoning tier deadline should match ADR-012 (600s)."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.tier_contract import get_tier_timeout
 
-        contract = create_tier_contract("reasoning")
-        tier_timeout = get_tier_timeout("reasoning")
+class TestTierContractTimeoutAlignment:
+    """Test that TierContract timeouts align with ADR-012 tier timeouts."""
 
-        assert contract.deadline_ms == tier_timeout["total"] * 1000
+    @pytest.mark.parametrize(
+        "tier,expected_total_ms",
+        [("quick", 30000), ("balanced", 90000), ("high", 180000), ("reasoning", 600000)],
+    )
+    def test_timeout_matches_adr012(self, tier, expected_total_ms):
+        """Tier deadline should match the ADR-012 total timeout."""
+        contract = create_tier_contract(tier)
+        assert contract.deadline_ms == expected_total_ms
+        assert contract.deadline_ms == get_tier_timeout(tier)["total"] * 1000
 
 
 class TestTierContractPerModelTimeout:
@@ -247,22 +276,17 @@ class TestTierContractPerModelTimeout:
 
     def test_tier_contract_has_per_model_timeout(self):
         """TierContract should have per_model_timeout_ms field."""
-        from llm_council.tier_contract import create_tier_contract
-
         contract = create_tier_contract("high")
         assert hasattr(contract, "per_model_timeout_ms")
         assert isinstance(contract.per_model_timeout_ms, int)
 
-    def test_per_model_timeout_matches_adr012(self):
+    @pytest.mark.parametrize("tier", ["quick", "balanced", "high", "reasoning"])
+    def test_per_model_timeout_matches_adr012(self, tier):
         """per_model_timeout_ms should align with ADR-012 tier timeouts."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.tier_contract import get_tier_timeout
-
-        for tier in ["quick", "balanced", "high", "reasoning"]:
-            contract = create_tier_contract(tier)
-            tier_timeout = get_tier_timeout(tier)
+        contract = create_tier_contract(tier)
+        tier_timeout = get_tier_timeout(tier)
 
-            assert contract.per_model_timeout_ms == tier_timeout["per_model"] * 1000
+        assert contract.per_model_timeout_ms == tier_timeout["per_model"] * 1000
 
 
 # =============================================================================
@@ -275,8 +299,6 @@ class TestTierContractReasoningConfig:
 
     def test_tier_contract_has_reasoning_config_field(self):
         """TierContract should have optional reasoning_config field."""
-        from llm_council.tier_contract import TierContract
-
         contract = TierContract(
             tier="high",
             deadline_ms=180000,
@@ -295,21 +317,12 @@ class TestTierContractReasoningConfig:
 
     def test_tier_contract_reasoning_config_none_when_disabled(self):
         """reasoning_config should be None when model intelligence disabled."""
-        from llm_council.tier_contract import create_tier_contract
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "false"}):
             contract = create_tier_contract("high")
             assert contract.reasoning_config is None
 
     def test_tier_contract_reasoning_config_populated_when_enabled(self):
         """reasoning_config should be populated when model intelligence enabled."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningConfig
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             contract = create_tier_contract("high")
             assert contract.reasoning_config is not None
@@ -317,11 +330,6 @@ class TestTierContractReasoningConfig:
 
     def test_reasoning_tier_uses_high_effort(self):
         """Reasoning tier should use HIGH effort."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningEffort
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             contract = create_tier_contract("reasoning")
             assert contract.reasoning_config is not None
@@ -329,11 +337,6 @@ class TestTierContractReasoningConfig:
 
     def test_quick_tier_uses_minimal_effort(self):
         """Quick tier should use MINIMAL effort."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningEffort
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             contract = create_tier_contract("quick")
             assert contract.reasoning_config is not None
@@ -341,11 +344,6 @@ class TestTierContractReasoningConfig:
 
     def test_balanced_tier_uses_low_effort(self):
         """Balanced tier should use LOW effort."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningEffort
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             contract = create_tier_contract("balanced")
             assert contract.reasoning_config is not None
@@ -353,11 +351,6 @@ class TestTierContractReasoningConfig:
 
     def test_high_tier_uses_medium_effort(self):
         """High tier should use MEDIUM effort."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningEffort
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             contract = create_tier_contract("high")
             assert contract.reasoning_config is not None
@@ -365,11 +358,6 @@ class TestTierContractReasoningConfig:
 
     def test_task_domain_overrides_tier_effort(self):
         """task_domain should override tier-default effort."""
-        from llm_council.tier_contract import create_tier_contract
-        from llm_council.reasoning import ReasoningEffort
-        from unittest.mock import patch
-        import os
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODEL_INTELLIGENCE": "true"}):
             # Math domain should override quick tier's MINIMAL to HIGH
             contract = create_tier_contract("quick", task_domain="math")
@@ -9,14 +9,16 @@ import os
 import pytest
 from unittest.mock import patch
 
+from llm_council import unified_config
+from llm_council.tier_contract import _DEFAULT_TIER_MODEL_POOLS, _get_tier_model_pools
+from llm_council.unified_config import get_config
+
 
 class TestTierModelPoolsStructure:
     """Test that tier model pools have correct structure."""
 
     def test_tier_model_pools_has_all_tiers(self):
         """Tier pools must contain quick, balanced, high, reasoning, frontier tiers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         assert "quick" in pools
         assert "balanced" in pools
@@ -26,8 +28,6 @@ class TestTierModelPoolsStructure:
 
     def test_each_tier_has_model_list(self):
         """Each tier must have a list of model identifiers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         for tier, models in pools.items():
             assert isinstance(models, list), f"Tier {tier} should have list of models"
@@ -35,8 +35,6 @@ class TestTierModelPoolsStructure:
 
     def test_models_are_valid_identifiers(self):
         """Models should be valid OpenRouter-style identifiers (provider/model)."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         for tier, models in pools.items():
             for model in models:
@@ -49,8 +47,6 @@ class TestDefaultTierModelPools:
 
     def test_quick_tier_has_fast_models(self):
         """Quick tier should have fast, low-latency models."""
-        from llm_council.tier_contract import _DEFAULT_TIER_MODEL_POOLS
-
         quick_models = _DEFAULT_TIER_MODEL_POOLS["quick"]
         # Quick tier should include mini/flash variants
         model_names = " ".join(quick_models).lower()
@@ -60,8 +56,6 @@ class TestDefaultTierModelPools:
 
     def test_reasoning_tier_has_reasoning_models(self):
         """Reasoning tier should have deep reasoning models."""
-        from llm_council.tier_contract import _DEFAULT_TIER_MODEL_POOLS
-
         reasoning_models = _DEFAULT_TIER_MODEL_POOLS["reasoning"]
         model_names = " ".join(reasoning_models).lower()
         # Should include o1, deepseek-r1, or similar reasoning models
@@ -71,8 +65,6 @@ class TestDefaultTierModelPools:
 
     def test_high_tier_is_default_equivalent(self):
         """High tier should be similar to current default COUNCIL_MODELS."""
-        from llm_council.tier_contract import _DEFAULT_TIER_MODEL_POOLS
-
         high_models = _DEFAULT_TIER_MODEL_POOLS["high"]
         # High tier should have 4+ models for full council
         assert len(high_models) >= 4, "High tier should have 4+ models for full council"
@@ -83,8 +75,6 @@ class TestProviderDiversity:
 
     def test_quick_tier_has_minimum_two_providers(self):
         """Quick tier must have at least 2 different providers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         quick_models = pools["quick"]
         providers = {model.split("/")[0] for model in quick_models}
@@ -92,8 +82,6 @@ class TestProviderDiversity:
 
     def test_balanced_tier_has_minimum_two_providers(self):
         """Balanced tier must have at least 2 different providers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         balanced_models = pools["balanced"]
         providers = {model.split("/")[0] for model in balanced_models}
@@ -101,8 +89,6 @@ class TestProviderDiversity:
 
     def test_high_tier_has_minimum_three_providers(self):
         """High tier should have at least 3 different providers for diversity."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         high_models = pools["high"]
         providers = {model.split("/")[0] for model in high_models}
@@ -114,104 +100,59 @@ class TestGetTierModels:
 
     def test_get_tier_models_returns_list(self):
         """Getting tier models returns a list of model identifiers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
         pools = _get_tier_model_pools()
         models = pools["quick"]
         assert isinstance(models, list)
         assert len(models) >= 2
 
-    def test_get_tier_models_for_all_tiers(self):
+    @pytest.mark.parametrize("tier", ["quick", "balanced", "high", "reasoning", "frontier"])
+    def test_get_tier_models_for_all_tiers(self, tier):
         """Can get models for all tiers."""
-        from llm_council.tier_contract import _get_tier_model_pools
-
-        pools = _get_tier_model_pools()
-        for tier in ["quick", "balanced", "high", "reasoning", "frontier"]:
-            models = pools[tier]
-            assert isinstance(models, list)
-            assert len(models) >= 2, f"{tier} tier should have at least 2 models"
+        models = _get_tier_model_pools()[tier]
+        assert isinstance(models, list)
+        assert len(models) >= 2, f"{tier} tier should have at least 2 models"
 
 
 class TestEnvironmentVariableOverrides:
     """Test per-tier environment variable overrides."""
 
-    def test_quick_tier_env_override(self):
-        """LLM_COUNCIL_MODELS_QUICK overrides quick tier models."""
-        from llm_council import unified_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
-        with patch.dict(os.environ, {"LLM_COUNCIL_MODELS_QUICK": "test/model-a,test/model-b"}):
-            unified_config.reload_config()
-            pools = _get_tier_model_pools()
-            assert pools["quick"] == ["test/model-a", "test/model-b"]
-
-        # Cleanup
-        unified_config.reload_config()
-
-    def test_balanced_tier_env_override(self):
-        """LLM_COUNCIL_MODELS_BALANCED overrides balanced tier models."""
-        from llm_council import unified_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
-        with patch.dict(
-            os.environ, {"LLM_COUNCIL_MODELS_BALANCED": "custom/model-1,custom/model-2"}
-        ):
-            unified_config.reload_config()
-            pools = _get_tier_model_pools()
-            assert pools["balanced"] == ["custom/model-1", "custom/model-2"]
-
-        # Cleanup
-        unified_config.reload_config()
-
-    def test_high_tier_env_override(self):
-        """LLM_COUNCIL_MODELS_HIGH overrides high tier models."""
-        from llm_council import unified_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
-        with patch.dict(os.environ, {"LLM_COUNCIL_MODELS_HIGH": "a/1,b/2,c/3,d/4"}):
-            unified_config.reload_config()
-            pools = _get_tier_model_pools()
-            assert pools["high"] == ["a/1", "b/2", "c/3", "d/4"]
-
-        # Cleanup
-        unified_config.reload_config()
-
-    def test_reasoning_tier_env_override(self):
-        """LLM_COUNCIL_MODELS_REASONING overrides reasoning tier models."""
-        from llm_council import unified_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
-        with patch.dict(
-            os.environ, {"LLM_COUNCIL_MODELS_REASONING": "openai/o1-preview,deepseek/deepseek-r1"}
-        ):
+    @pytest.fixture(autouse=True)
+    def restore_global_config(self, monkeypatch):
+        """Restore the cached config object on teardown instead of reloading it."""
+        monkeypatch.setattr(unified_config, "_global_config", unified_config.get_config())
+
+    @pytest.mark.parametrize(
+        "tier,value,expected",
+        [
+            ("quick", "test/model-a,test/model-b", ["test/model-a", "test/model-b"]),
+            ("balanced", "custom/model-1,custom/model-2", ["custom/model-1", "custom/model-2"]),
+            ("high", "a/1,b/2,c/3,d/4", ["a/1", "b/2", "c/3", "d/4"]),
+            (
+                "reasoning",
+                "openai/o1-preview,deepseek/deepseek-r1",
+                ["openai/o1-preview", "deepseek/deepseek-r1"],
+            ),
+        ],
+    )
+    def test_tier_env_override(self, tier, value, expected):
+        """LLM_COUNCIL_MODELS_<TIER> overrides that tier's models."""
+        with patch.dict(os.environ, {f"LLM_COUNCIL_MODELS_{tier.upper()}": value}):
             unified_config.reload_config()
-            pools = _get_tier_model_pools()
-            assert pools["reasoning"] == ["openai/o1-preview", "deepseek/deepseek-r1"]
-
-        # Cleanup
-        unified_config.reload_config()
+            assert _get_tier_model_pools()[tier] == expected
 
     def test_env_override_strips_whitespace(self):
         """Environment variable values should have whitespace stripped."""
-        from llm_council import unified_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
         with patch.dict(os.environ, {"LLM_COUNCIL_MODELS_QUICK": " model/a , model/b "}):
             unified_config.reload_config()
             pools = _get_tier_model_pools()
             assert pools["quick"] == ["model/a", "model/b"]
 
-        # Cleanup
-        unified_config.reload_config()
-
 
 class TestBackwardCompatibility:
     """Test backward compatibility with existing COUNCIL_MODELS."""
 
     def test_council_models_available_via_config(self):
         """Council models should be available via unified_config."""
-        from llm_council.unified_config import get_config
-
         config = get_config()
         council_models = config.council.models
         assert isinstance(council_models, list)
@@ -219,9 +160,6 @@ class TestBackwardCompatibility:
 
     def test_high_tier_has_sufficient_models(self):
         """High tier should have enough models for a full council."""
-        from llm_council.unified_config import get_config
-        from llm_council.tier_contract import _get_tier_model_pools
-
         config = get_config()
         pools = _get_tier_model_pools()
         high_models = pools["high"]
@@ -291,7 +291,7 @@ class TestRunTriageStub:
         result = run_triage("Test query", tier_contract=tier_contract)
 
         # Should use tier's allowed models
-        assert result.resolved_models == tier_contract.allowed_models
+        assert result.resolved_models == list(tier_contract.allowed_models)
 
     def test_run_triage_metadata_includes_stub_indicator(self):
         """Stub run_triage should indicate it's a passthrough in metadata."""
@@ -119,6 +119,19 @@ council:
         config = load_config(config_file)
         assert config.tiers.default == "high"  # Default value
 
+    def test_load_config_skips_exists_probe(self, tmp_path):
+        """Missing files are detected by the read itself, not a separate stat."""
+        from unittest.mock import patch
+
+        with patch.object(Path, "exists", side_effect=AssertionError("unexpected stat")):
+            config = load_config(tmp_path / "missing.yaml")
+        assert config.tiers.default == "high"
+
+    def test_load_config_directory_path_strict_raises(self, tmp_path):
+        """An unreadable path is a configuration error in strict mode."""
+        with pytest.raises(ValueError, match="Configuration error"):
+            load_config(tmp_path, strict=True)
+
     def test_load_config_with_partial_yaml(self, tmp_path):
         """Should merge partial YAML with defaults."""
         config_file = tmp_path / "llm_council.yaml"
@@ -212,6 +225,15 @@ council:
             config = get_effective_config(config_file)
             assert config.triage.enabled is True
 
+    @pytest.mark.parametrize(
+        "value,expected", [("YES", True), ("1", True), ("True", True), ("on", False)]
+    )
+    def test_boolean_env_var_spellings(self, value, expected):
+        """Boolean env vars accept true/1/yes in any case."""
+        with patch.dict(os.environ, {"LLM_COUNCIL_CACHE": value}):
+            config = get_effective_config(None)
+            assert config.cache.enabled is expected
+
     def test_env_var_overrides_tier_models(self, tmp_path):
         """Should override tier models via env var (comma-separated)."""
         with patch.dict(os.environ, {"LLM_COUNCIL_MODELS_QUICK": "model-a,model-b"}):
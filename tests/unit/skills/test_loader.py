@@ -108,6 +108,15 @@ class TestSkillMetadata:
         # Minimal metadata should be small
         assert 10 <= metadata.estimated_tokens <= 50
 
+    def test_metadata_token_estimate_is_cached(self):
+        """Token estimate should be computed once and excluded from equality."""
+        metadata = SkillMetadata(name="test-skill", description="A test skill.")
+        first = metadata.estimated_tokens
+
+        assert metadata.estimated_tokens == first
+        assert metadata == SkillMetadata(name="test-skill", description="A test skill.")
+        assert "_estimated_tokens" not in repr(metadata)
+
 
 class TestLoadSkillMetadata:
     """Tests for Level 1: Metadata extraction."""
@@ -197,6 +206,19 @@ class TestLoadSkillFull:
         assert result.estimated_tokens > result.metadata.estimated_tokens
         assert result.estimated_tokens < 2000  # Reasonable upper bound
 
+    def test_load_full_parses_frontmatter_once(self):
+        """Full load should not re-parse frontmatter to build metadata."""
+        from unittest.mock import patch
+
+        from llm_council.skills import loader
+
+        with patch.object(
+            loader, "_load_frontmatter_yaml", wraps=loader._load_frontmatter_yaml
+        ) as spy:
+            load_skill_full(SAMPLE_SKILL_MD)
+
+        assert spy.call_count == 1
+
 
 class TestSkillLoader:
     """Tests for SkillLoader class."""
@@ -297,6 +319,36 @@ class TestSkillLoader:
         # Should be same object (cached)
         assert meta1 is meta2
 
+    def test_loader_metadata_does_not_decode_body(self, skill_dir: Path):
+        """Level 1 loading should not depend on the body being decodable."""
+        binary_dir = skill_dir / "binary-body"
+        binary_dir.mkdir()
+        (binary_dir / "SKILL.md").write_bytes(
+            b"---\nname: binary-body\ndescription: Body is not UTF-8.\n---\n\n\xff\xfe"
+        )
+
+        loader = SkillLoader(skill_dir)
+        metadata = loader.load_metadata("binary-body")
+
+        assert metadata.name == "binary-body"
+
+    def test_loader_normalizes_crlf_line_endings(self, skill_dir: Path):
+        """CRLF skill files should load the same as LF files."""
+        crlf_dir = skill_dir / "crlf-skill"
+        crlf_dir.mkdir()
+        (crlf_dir / "SKILL.md").write_bytes(
+            SAMPLE_SKILL_MINIMAL.replace("minimal-skill", "crlf-skill")
+            .replace("\n", "\r\n")
+            .encode("utf-8")
+        )
+
+        loader = SkillLoader(skill_dir)
+        full = loader.load_full("crlf-skill")
+
+        assert full.metadata.name == "crlf-skill"
+        assert full.metadata.description == "Minimal skill with required fields only."
+        assert full.body == "# Minimal Skill\n\nBasic content."
+
 
 class TestLoadSkillResource:
     """Tests for Level 3: Resource loading."""
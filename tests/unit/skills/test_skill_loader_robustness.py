@@ -387,6 +387,69 @@ license: Apache-2.0
         assert m3.description == "Updated description"
 
 
+class TestDiskCache:
+    """Tests for the optional persistent metadata cache."""
+
+    def test_disk_cache_reused_across_loaders(self, temp_skills_dir: Path, tmp_path: Path):
+        """A new loader should reuse metadata persisted by a previous one."""
+        cache_path = tmp_path / "cache" / "skills.json"
+
+        first = SkillLoader(temp_skills_dir, disk_cache_path=cache_path)
+        original = first.load_metadata("test-skill")
+        first.close()
+        assert cache_path.exists()
+
+        second = SkillLoader(temp_skills_dir, disk_cache_path=cache_path)
+        with patch("llm_council.skills.loader._parse_frontmatter_bytes") as parse:
+            cached = second.load_metadata("test-skill")
+
+        parse.assert_not_called()
+        assert cached == original
+
+    def test_disk_cache_misses_when_file_changes(self, temp_skills_dir: Path, tmp_path: Path):
+        """Entries should be ignored once SKILL.md's size or mtime changes."""
+        cache_path = tmp_path / "skills.json"
+        skill_md = temp_skills_dir / "test-skill" / SKILL_FILENAME
+
+        first = SkillLoader(temp_skills_dir, disk_cache_path=cache_path)
+        first.load_metadata("test-skill")
+        first.close()
+
+        skill_md.write_text(
+            skill_md.read_text(encoding="utf-8").replace(
+                "A test skill for unit testing.", "A changed description."
+            ),
+            encoding="utf-8",
+        )
+
+        second = SkillLoader(temp_skills_dir, disk_cache_path=cache_path)
+        assert second.load_metadata("test-skill").description == "A changed description."
+
+    def test_corrupt_disk_cache_is_ignored(self, temp_skills_dir: Path, tmp_path: Path):
+        """An unreadable cache file should not break loading."""
+        cache_path = tmp_path / "skills.json"
+        cache_path.write_text("{not json", encoding="utf-8")
+
+        loader = SkillLoader(temp_skills_dir, disk_cache_path=cache_path)
+        assert loader.load_metadata("test-skill").name == "test-skill"
+
+    def test_no_disk_cache_by_default(
+        self, temp_skills_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Without disk_cache_path, close() should write nothing."""
+        from llm_council.skills import loader as loader_module
+
+        default_path = tmp_path / "default" / "skills.json"
+        monkeypatch.setattr(loader_module, "DEFAULT_DISK_CACHE_PATH", default_path)
+
+        loader = SkillLoader(temp_skills_dir)
+        loader.load_metadata("test-skill")
+        loader.close()
+
+        assert loader._disk_cache_path is None
+        assert not default_path.exists()
+
+
 # =============================================================================
 # Tests for Logging (#296)
 # =============================================================================
@@ -0,0 +1,348 @@
+"""
+Unit tests for verdict extraction from council output (ADR-034).
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from llm_council.verification.verdict_extractor import (
+    APPROVED_PATTERNS,
+    REJECTED_PATTERNS,
+    RUBRIC_DIMENSIONS,
+    build_verification_result,
+    calculate_confidence_from_agreement,
+    extract_blocking_issues,
+    extract_rubric_scores_from_rankings,
+    extract_verdict_from_synthesis,
+)
+
+
+def _per_pattern_counts(text: str):
+    """Reference implementation: one re.search per pattern."""
+    upper = text.upper()
+    approved = sum(1 for p in APPROVED_PATTERNS if re.search(p, upper))
+    rejected = sum(1 for p in REJECTED_PATTERNS if re.search(p, upper))
+    return approved, rejected
+
+
+class TestExtractVerdictFromSynthesis:
+    """Tests for extract_verdict_from_synthesis()."""
+
+    def test_clear_approval(self):
+        verdict, confidence = extract_verdict_from_synthesis({"response": "APPROVED."})
+        assert verdict == "pass"
+        assert confidence == pytest.approx(0.80)
+
+    def test_clear_rejection(self):
+        verdict, confidence = extract_verdict_from_synthesis(
+            {"response": "The change is rejected and tests failed."}
+        )
+        assert verdict == "fail"
+        assert confidence == pytest.approx(0.90)
+
+    def test_repeated_keyword_counts_once(self):
+        """Repeated occurrences of one pattern do not raise confidence."""
+        once = extract_verdict_from_synthesis({"response": "Approved."})
+        many = extract_verdict_from_synthesis({"response": "Approved. Approved. APPROVED!"})
+        assert once == many
+
+    def test_not_recommended_is_mixed_signal(self):
+        verdict, confidence = extract_verdict_from_synthesis({"response": "Not recommended."})
+        assert verdict == "unclear"
+        assert confidence == 0.50
+
+    def test_mixed_case_keywords(self):
+        verdict, _ = extract_verdict_from_synthesis({"response": "Looks good, Passed and aCCepted"})
+        assert verdict == "pass"
+
+    def test_no_signal(self):
+        assert extract_verdict_from_synthesis({}) == ("unclear", 0.50)
+
+    @pytest.mark.parametrize("response", [None, ""])
+    def test_empty_response_skips_scan(self, response):
+        from llm_council.verification import verdict_extractor
+
+        with patch.object(verdict_extractor, "_scan_synthesis") as mock_scan:
+            assert extract_verdict_from_synthesis({"response": response}) == ("unclear", 0.50)
+            assert extract_blocking_issues({"response": response}) == []
+            result = build_verification_result([], [], {"response": response})
+
+        mock_scan.assert_not_called()
+        assert result["verdict"] == "unclear"
+
+    def test_short_text_without_markers_skips_regex(self):
+        from llm_council.verification import verdict_extractor
+
+        with patch.object(verdict_extractor, "_SYNTHESIS_RE") as mock_re:
+            result = extract_verdict_from_synthesis({"response": "Looks fine overall."})
+
+        mock_re.finditer.assert_not_called()
+        assert result == ("unclear", 0.50)
+
+    @pytest.mark.parametrize(
+        "text,verdict",
+        [
+            ("Pa\u017fsed.", "pass"),  # long s folds to s under IGNORECASE
+            ("Fa\u0131led.", "fail"),  # dotless i matches i under IGNORECASE
+            ("FA\u0130LED.", "fail"),  # dotted capital I matches i under IGNORECASE
+            ("DEN\u0130ED.", "fail"),
+            ("Passport and bypass are not verdicts.", "unclear"),
+        ],
+    )
+    def test_prefilter_agrees_with_regex(self, text, verdict):
+        assert extract_verdict_from_synthesis({"response": text})[0] == verdict
+
+    def test_prefilter_keeps_dotted_capital_i_issues(self):
+        """Short text with U+0130 still yields the issue the regex finds."""
+        text = "CR\u0130T\u0130CAL: SQL injection in db.py:12"
+        short = extract_blocking_issues({"response": text})
+        padded = extract_blocking_issues({"response": text + "\n" + "x" * 5000})
+
+        assert len(short) == 1
+        assert short[0]["description"] == "SQL injection in db.py:12"
+        assert short == padded
+
+    def test_marker_initials_cover_all_patterns(self):
+        """The scanner's first-character guard must admit every verdict pattern."""
+        from llm_council.verification.verdict_extractor import _MARKER_INITIALS
+
+        for pattern in APPROVED_PATTERNS + REJECTED_PATTERNS:
+            first = pattern.removeprefix(r"\b")[0]
+            assert first in _MARKER_INITIALS, pattern
+        for severity in ("CRITICAL", "MAJOR", "MINOR"):
+            assert severity[0] in _MARKER_INITIALS
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Approved and passed, also accepted and recommended.",
+            "Passed review but the build FAILED; denied.",
+            "PASSED. PASS. passes? passing",
+            "Not recommended, rejected, fail",
+            "failing tests, unaccepted",
+        ],
+    )
+    def test_matches_per_pattern_search(self, text):
+        """Combined alternation agrees with searching each pattern separately."""
+        approved, rejected = _per_pattern_counts(text)
+        verdict, _ = extract_verdict_from_synthesis({"response": text})
+        if approved > rejected:
+            assert verdict == "pass"
+        elif rejected > approved:
+            assert verdict == "fail"
+        else:
+            assert verdict == "unclear"
+
+
+def _reference_issues(text: str):
+    """Reference implementation: dedicated issue scan plus per-issue location search."""
+    issues = []
+    pattern = r"(?P<severity>CRITICAL|MAJOR|MINOR)[:\s]+(?P<description>[^\n]+)"
+    for match in re.finditer(pattern, text, re.IGNORECASE):
+        description = match.group("description").strip()
+        loc = re.search(r"(?:in|at)\s+([^\s]+\.py:\d+|\S+\.py)", description)
+        issues.append(
+            {
+                "severity": match.group("severity").lower(),
+                "description": description,
+                "location": loc.group(1) if loc else None,
+            }
+        )
+    return issues
+
+
+class TestExtractBlockingIssues:
+    """Tests for extract_blocking_issues()."""
+
+    def test_issue_with_location(self):
+        issues = extract_blocking_issues(
+            {"response": "CRITICAL: SQL injection in app/db.py:42\nMinor: typo"}
+        )
+        assert issues == [
+            {
+                "severity": "critical",
+                "description": "SQL injection in app/db.py:42",
+                "location": "app/db.py:42",
+            },
+            {"severity": "minor", "description": "typo", "location": None},
+        ]
+
+    @pytest.mark.parametrize(
+        "description,location",
+        [
+            ("race in worker.py:88", "worker.py:88"),
+            ("bad import at pkg/mod.py", "pkg/mod.py"),
+            ("bad import at pkg/mod.py:", "pkg/mod.py"),
+            ("missing check within utils.py", "utils.py"),
+            ("regression in README.md", None),
+        ],
+    )
+    def test_location_forms(self, description, location):
+        issues = extract_blocking_issues({"response": f"MAJOR: {description}"})
+        assert issues[0]["location"] == location
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "CRITICAL: major regression, minor cleanup needed\nMAJOR: FAILED at x.py",
+            "Verdict: REJECTED\n\nCRITICAL:\n\nnull deref in core.py:10",
+            "no issues here",
+            "critical minor major",
+            "SUBMINOR: odd\nMAJOR issue, tests failed but approved anyway",
+        ],
+    )
+    def test_matches_dedicated_scan(self, text):
+        """The fused synthesis scan reports the same issues as a dedicated scan."""
+        assert extract_blocking_issues({"response": text}) == _reference_issues(text)
+
+
+class TestExtractRubricScoresFromRankings:
+    """Tests for extract_rubric_scores_from_rankings()."""
+
+    def test_dimension_means(self):
+        rankings = [
+            {"rubric_scores": {"accuracy": 9, "clarity": 8.5, "unknown": 7}},
+            {"rubric_scores": {"accuracy": 8, "clarity": 7.0, "relevance": 11}},
+            {"rubric_scores": "not a dict"},
+        ]
+        result = extract_rubric_scores_from_rankings(rankings)
+
+        assert result == {
+            "accuracy": 8.5,
+            "relevance": None,
+            "completeness": None,
+            "conciseness": None,
+            "clarity": 7.8,
+        }
+
+    def test_matches_statistics_mean(self):
+        import random
+        import statistics
+
+        rng = random.Random(7)
+        rankings = [
+            {"rubric_scores": {d: round(rng.uniform(0, 10), 2) for d in RUBRIC_DIMENSIONS}}
+            for _ in range(25)
+        ]
+        result = extract_rubric_scores_from_rankings(rankings)
+
+        for dim in RUBRIC_DIMENSIONS:
+            expected = round(statistics.mean(r["rubric_scores"][dim] for r in rankings), 1)
+            assert result[dim] == expected
+
+    def test_falls_back_to_response_scores(self):
+        rankings = [{"parsed_ranking": {"scores": {"Response A": 9, "Response B": 6}}}]
+        result = extract_rubric_scores_from_rankings(rankings)
+
+        assert result["accuracy"] == 9.0
+        assert result["clarity"] == 7.5
+        assert result["completeness"] == 6.8
+        assert result["relevance"] is None
+
+
+class TestCalculateConfidenceFromAgreement:
+    """Tests for calculate_confidence_from_agreement()."""
+
+    @staticmethod
+    def _reference(stage2_results, verdict):
+        """Reference confidence computed with the statistics module."""
+        import statistics
+        from collections import Counter
+
+        scores, tops = [], []
+        for ranking in stage2_results:
+            parsed = ranking.get("parsed_ranking")
+            if isinstance(parsed, dict):
+                tops.append(parsed["ranking"][0])
+                scores.extend(float(v) for v in parsed["scores"].values())
+            scores.extend(float(v) for v in ranking.get("rubric_scores", {}).values())
+        mean = statistics.mean(scores)
+        variance = statistics.variance(scores) if len(scores) > 1 else 0
+        agreement = Counter(tops).most_common(1)[0][1] / len(tops)
+        if verdict == "pass":
+            base = min(1.0, max(0.3, (mean - 5) / 5))
+        else:
+            base = min(1.0, max(0.3, (5 - mean) / 5 + 0.5))
+        confidence = base - min(0.20, variance / 10) + agreement * 0.15
+        confidence += min(0.10, len(stage2_results) * 0.02)
+        return round(max(0.0, min(1.0, confidence)), 2)
+
+    def test_no_reviews(self):
+        assert calculate_confidence_from_agreement([], "pass") == 0.50
+
+    def test_single_score_has_no_variance_penalty(self):
+        stage2 = [{"parsed_ranking": {"ranking": ["A"], "scores": {"A": 10}}}]
+        # base 1.0 + full agreement 0.15 + one reviewer 0.02, clamped to 1.0
+        assert calculate_confidence_from_agreement(stage2, "pass") == 1.0
+
+    def test_identical_scores_have_zero_variance(self):
+        stage2 = [
+            {"parsed_ranking": {"ranking": ["A"], "scores": {"A": 9.7, "B": 9.7}}},
+            {"parsed_ranking": {"ranking": ["B"], "scores": {"A": 9.7, "B": 9.7}}},
+        ]
+        # base min(1.0, 0.94) + half agreement 0.075 + two reviewers 0.04
+        assert calculate_confidence_from_agreement(stage2, "pass") == 1.0
+        assert calculate_confidence_from_agreement(stage2, "fail") == 0.41
+
+    @pytest.mark.parametrize("verdict", ["pass", "fail"])
+    def test_matches_statistics_reference(self, verdict):
+        import random
+
+        rng = random.Random(3)
+        stage2 = [
+            {
+                "parsed_ranking": {
+                    "ranking": [rng.choice("AB")],
+                    "scores": {"A": rng.randint(2, 9), "B": rng.uniform(1, 9)},
+                },
+                "rubric_scores": {"accuracy": rng.uniform(0, 10)},
+            }
+            for _ in range(6)
+        ]
+        assert calculate_confidence_from_agreement(stage2, verdict) == self._reference(
+            stage2, verdict
+        )
+
+
+class TestBuildVerificationResult:
+    """Tests for build_verification_result()."""
+
+    def test_scans_synthesis_once(self):
+        from llm_council.verification import verdict_extractor
+
+        stage3 = {"response": "REJECTED.\nCRITICAL: crash in main.py:3"}
+        with patch.object(
+            verdict_extractor, "_scan_synthesis", wraps=verdict_extractor._scan_synthesis
+        ) as spy:
+            result = build_verification_result([], [], stage3)
+
+        assert spy.call_count == 1
+        assert result["verdict"] == "fail"
+        assert result["blocking_issues"] == _reference_issues(stage3["response"])
+
+    def test_repeated_synthesis_reuses_scan(self):
+        from llm_council.verification import verdict_extractor
+
+        verdict_extractor._scan_synthesis.cache_clear()
+        stage3 = {"response": "FAILED.\nMAJOR: leak in pool.py:7"}
+        with patch.object(
+            verdict_extractor, "_SYNTHESIS_RE", wraps=verdict_extractor._SYNTHESIS_RE
+        ) as spy:
+            first = build_verification_result([], [], stage3)
+            second = build_verification_result([], [], dict(stage3))
+
+        assert spy.finditer.call_count == 1
+        assert first == second
+        # Callers get their own issue dicts even when the scan is reused
+        first["blocking_issues"][0]["severity"] = "changed"
+        assert extract_blocking_issues(stage3)[0]["severity"] == "major"
+
+    def test_pass_verdict_has_no_blocking_issues(self):
+        stage3 = {"response": "APPROVED and ACCEPTED. MINOR: nit in docs"}
+        stage2 = [{"parsed_ranking": {"ranking": ["A"], "scores": {"A": 9, "B": 9}}}]
+        result = build_verification_result([], stage2, stage3)
+
+        assert result["verdict"] == "pass"
+        assert result["blocking_issues"] == []